@@ -0,0 +1,185 @@
+"""Run one day's solution over many input files
+
+Every worker process loads the day module once and keeps it (and its memo
+tables, e.g. day19's `lru_cache`) for all the inputs it gets. Parsed inputs
+are cached (`aoc.parsecache`, disable with `--no-cache`). Results are
+streamed as CSV or JSON lines in completion order, one record per input.
+
+Usage: python -m aoc.batch DAY INPUT [INPUT ...] [--format csv|jsonl]
+                           [--jobs N] [--output FILE] [--no-cache]
+
+INPUT is a file, a directory (all files inside) or a glob pattern.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Iterable, Iterator, TextIO
+
+from aoc import parsecache
+from aoc.days import PART_NAMES, get_parts, load_day, normalize_day
+from aoc.runner import timed
+
+
+T_Record = dict[str, Any]
+
+# Per worker process: (module, parts, kwargs, use parse cache) of the day being run
+_WORKER_STATE: tuple[Any, dict, dict[str, Any], bool] | None = None
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[str]:
+    files = []
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.extend(
+                os.path.join(pattern, name)
+                for name in sorted(os.listdir(pattern))
+                if os.path.isfile(os.path.join(pattern, name))
+            )
+        elif os.path.isfile(pattern):
+            files.append(pattern)
+        else:
+            files.extend(sorted(glob.glob(pattern)))
+
+    return files
+
+
+def _init_worker(day: str, kwargs: dict[str, Any], use_cache: bool) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (load_day(day), get_parts(day), kwargs, use_cache)
+
+
+def solve_file(file: str) -> T_Record:
+    """Parse and solve one input with the day loaded by `_init_worker`"""
+    module, parts, kwargs, use_cache = _WORKER_STATE
+    record = {"input": file, "status": "ok"}
+
+    try:
+        if use_cache:
+            data, timing = timed(parsecache.read_input, module, file)
+        else:
+            data, timing = timed(module.read_input, file)
+        record["parse_wall"] = timing["wall"]
+
+        for name, part in parts.items():
+            answer, timing = timed(part, module, data, **kwargs)
+            record[name] = str(answer)
+            record[f"{name}_wall"] = timing["wall"]
+    except Exception as exc:
+        record["status"] = "error"
+        record["error"] = f"{type(exc).__name__}: {exc}"
+
+    return record
+
+
+def run_batch(
+    day: str,
+    files: list[str],
+    max_workers: int | None = None,
+    kwargs: dict[str, Any] | None = None,
+    use_cache: bool = True,
+) -> Iterator[T_Record]:
+    """Records in completion order (input order for a single worker)"""
+    kwargs = kwargs or {}
+
+    if max_workers == 1:
+        _init_worker(day, kwargs, use_cache)
+        yield from map(solve_file, files)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(day, kwargs, use_cache),
+    ) as executor:
+        futures = [executor.submit(solve_file, file) for file in files]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def csv_columns() -> list[str]:
+    columns = ["input", "status", "parse_wall"]
+    for name in PART_NAMES:
+        columns.extend((name, f"{name}_wall"))
+    columns.append("error")
+    return columns
+
+
+def write_records(records: Iterable[T_Record], fout: TextIO, fmt: str) -> tuple[int, int]:
+    """Streams the records, returns the number of inputs and of errors"""
+    num_records, num_errors = 0, 0
+
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(fout, fieldnames=csv_columns())
+        writer.writeheader()
+
+    for record in records:
+        if writer is not None:
+            writer.writerow(record)
+        else:
+            fout.write(json.dumps(record) + "\n")
+        fout.flush()
+
+        num_records += 1
+        num_errors += record["status"] == "error"
+
+    return num_records, num_errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run one day over many input files")
+    parser.add_argument("day", help="Day to run, e.g. `5` or `day05`")
+    parser.add_argument("inputs", nargs="+", help="Input files, directories or glob patterns")
+    parser.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        default="csv",
+        help="Output format (default: csv)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes, 0 means all cores (default: 0)",
+    )
+    parser.add_argument("-o", "--output", default=None, help="Output file (default: stdout)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the parse cache")
+    args = parser.parse_args(argv)
+
+    day = normalize_day(args.day)
+    files = expand_inputs(args.inputs)
+
+    start = time.perf_counter()
+    records = run_batch(
+        day,
+        files,
+        max_workers=args.jobs or os.cpu_count(),
+        use_cache=not args.no_cache,
+    )
+
+    if args.output is None:
+        num_records, num_errors = write_records(records, sys.stdout, args.format)
+    else:
+        with open(args.output, "w", newline="") as fout:
+            num_records, num_errors = write_records(records, fout, args.format)
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{num_records} inputs ({num_errors} errors) in {elapsed:.2f}s, "
+        f"{num_records / elapsed if elapsed > 0 else 0.0:.1f} inputs/s",
+        file=sys.stderr,
+    )
+
+    return int(num_errors > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""Benchmark the daily solutions against a stored baseline
+
+Every part is run repeatedly on the stock input (`dayNN/data/input.txt`) and
+on generated inputs of the given scales; min/median wall-clock times are
+compared with the baseline and the run fails when a part got slower than the
+threshold allows.
+
+Usage: python -m aoc.bench [DAY ...] [--scales S ...] [--repeat N]
+                           [--baseline FILE] [--update] [--threshold T]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+from typing import Any
+
+from aoc.days import get_parts, input_path, list_days, load_day, normalize_day
+from aoc.generators import part_kwargs, write_input
+from aoc.runner import timed
+
+
+T_Stats = dict[str, Any]
+
+DEFAULT_BASELINE = "bench_baseline.json"
+
+
+def bench_input(
+    day: str,
+    file: str,
+    repeat: int,
+    kwargs: dict[str, Any],
+) -> dict[str, T_Stats]:
+    module = load_day(day)
+    stats = {}
+
+    for name, part in get_parts(day).items():
+        timings = []
+
+        for _ in range(repeat):
+            # Re-parse, so that a part can't benefit from mutated input data
+            data = module.read_input(file)
+            _, timing = timed(part, module, data, **kwargs)
+            timings.append(timing["wall"])
+
+        stats[name] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "repeat": repeat,
+        }
+
+    return stats
+
+
+def run_benchmarks(
+    days: list[str],
+    scales: list[float],
+    repeat: int,
+    seed: int = 0,
+    stock: bool = True,
+) -> tuple[dict[str, T_Stats], dict[str, str]]:
+    """Returns stats keyed by `dayNN/part/input` and errors for failed inputs"""
+    results = {}
+    errors = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for day in days:
+            inputs = []
+
+            if stock and os.path.isfile(input_path(day)):
+                inputs.append(("input", input_path(day), {}))
+
+            for scale in scales:
+                label = f"scale={scale:g}"
+                try:
+                    file = write_input(day, tmp_dir, scale=scale, seed=seed)
+                    inputs.append((label, file, part_kwargs(day, scale)))
+                except Exception as exc:
+                    errors[f"{day}/{label}"] = f"{type(exc).__name__}: {exc}"
+
+            for label, file, kwargs in inputs:
+                try:
+                    stats = bench_input(day, file, repeat, kwargs)
+                except Exception as exc:
+                    errors[f"{day}/{label}"] = f"{type(exc).__name__}: {exc}"
+                    continue
+
+                for name, part_stats in stats.items():
+                    results[f"{day}/{name}/{label}"] = part_stats
+
+    return results, errors
+
+
+def compare(
+    results: dict[str, T_Stats],
+    baseline: dict[str, T_Stats],
+    threshold: float,
+    metric: str = "min",
+) -> list[str]:
+    """Keys of the benchmarks that got slower than `(1 + threshold) * baseline`"""
+    return [
+        key
+        for key, stats in results.items()
+        if key in baseline
+        and stats[metric] > (1 + threshold) * baseline[key][metric]
+    ]
+
+
+def format_report(
+    results: dict[str, T_Stats],
+    baseline: dict[str, T_Stats],
+    regressions: list[str],
+    metric: str = "min",
+) -> str:
+    header = f"{'Benchmark':<32} {'Min [s]':>10} {'Median [s]':>11} {'Baseline':>10} {'Change':>8}"
+    lines = [header, "-" * len(header)]
+
+    for key, stats in results.items():
+        line = f"{key:<32} {stats['min']:>10.4f} {stats['median']:>11.4f}"
+
+        if key in baseline:
+            reference = baseline[key][metric]
+            change = stats[metric] / reference - 1 if reference > 0 else 0.0
+            line += f" {reference:>10.4f} {change:>+8.1%}"
+
+        if key in regressions:
+            line += "  REGRESSION"
+
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the daily solutions")
+    parser.add_argument("days", nargs="*", help="Days to benchmark (default: all)")
+    parser.add_argument(
+        "--scales",
+        nargs="*",
+        type=float,
+        default=[1.0],
+        help="Scales of the generated inputs (default: 1)",
+    )
+    parser.add_argument(
+        "--no-stock",
+        action="store_true",
+        help="Skip the stock inputs from `dayNN/data/input.txt`",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per part (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help=f"Baseline JSON file (default: {DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Store the results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown relative to the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--metric",
+        choices=("min", "median"),
+        default="min",
+        help="Statistic compared with the baseline (default: min)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    days = [normalize_day(day) for day in args.days] or list_days()
+
+    results, errors = run_benchmarks(
+        days,
+        scales=args.scales,
+        repeat=args.repeat,
+        seed=args.seed,
+        stock=not args.no_stock,
+    )
+
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline, "r") as fin:
+            baseline = json.load(fin)
+
+    regressions = compare(results, baseline, args.threshold, args.metric)
+
+    print(format_report(results, baseline, regressions, args.metric))
+
+    for key, error in errors.items():
+        print(f"{key}: {error}")
+
+    if args.update or not baseline:
+        with open(args.baseline, "w") as fout:
+            json.dump({**baseline, **results}, fout, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+
+    failed = bool(errors) or (bool(regressions) and not args.update)
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
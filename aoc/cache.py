@@ -0,0 +1,189 @@
+"""Content-addressed cache of solved inputs
+
+Answers are keyed by the SHA-256 of the input bytes, of the day's source code
+(including the `aoc` helpers it uses and `aoc.days`, which decides how each
+part is called), the part and its keyword arguments, so any change to the
+input or the code is a cache miss. Entries live in a
+local SQLite database, the least recently used ones are evicted once the
+database grows over its size limit.
+
+Usage: python -m aoc.cache [--clear] [--path FILE]
+"""
+import argparse
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import time
+from types import ModuleType
+from typing import Any
+
+from aoc import days
+from aoc.days import ROOT_DIR
+
+
+DEFAULT_PATH = os.path.join(ROOT_DIR, ".cache", "results.sqlite")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+MISSING = object()
+
+
+def hash_file(file: str) -> str:
+    with open(file, "rb") as fin:
+        return hashlib.file_digest(fin, "sha256").hexdigest()
+
+
+def source_files(module: ModuleType) -> set[str]:
+    """Source files of the module and of all the `aoc` modules it (transitively) uses"""
+    files = set()
+    pending = [module]
+    seen = set()
+
+    while pending:
+        current = pending.pop()
+        if current.__name__ in seen:
+            continue
+
+        seen.add(current.__name__)
+        files.add(inspect.getfile(current))
+
+        for value in vars(current).values():
+            dependency = value if isinstance(value, ModuleType) else inspect.getmodule(value)
+
+            if dependency is not None and dependency.__name__.startswith("aoc."):
+                pending.append(dependency)
+
+    return files
+
+
+def hash_code(module: ModuleType) -> str:
+    """Digest of the module's sources and of the part table (`_PARTS` / `_VARIANTS`)"""
+    digest = hashlib.sha256()
+
+    for file in sorted(source_files(module) | {inspect.getfile(days)}):
+        with open(file, "rb") as fin:
+            digest.update(fin.read())
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+
+    def __init__(self, path: str = DEFAULT_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL"
+            ")"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)"
+        )
+        self._db.commit()
+
+        self._code_hashes: dict[str, str] = {}
+
+    def key(
+        self,
+        module: ModuleType,
+        part_name: str,
+        file: str,
+        kwargs: dict[str, Any] | None = None,
+    ) -> str:
+        if module.__name__ not in self._code_hashes:
+            self._code_hashes[module.__name__] = hash_code(module)
+
+        parts = [
+            self._code_hashes[module.__name__],
+            hash_file(file),
+            part_name,
+            repr(sorted((kwargs or {}).items())),
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Cached value, or `MISSING`"""
+        row = self._db.execute(
+            "SELECT value FROM results WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return MISSING
+
+        self._db.execute(
+            "UPDATE results SET last_access = ? WHERE key = ?",
+            (time.time(), key),
+        )
+        self._db.commit()
+
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, value, size, last_access)"
+            " VALUES (?, ?, ?, ?)",
+            (key, blob, len(blob), time.time()),
+        )
+        self._evict()
+        self._db.commit()
+
+    def _evict(self) -> None:
+        total_size = self.size()
+        if total_size <= self.max_bytes:
+            return
+
+        to_delete = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM results ORDER BY last_access"
+        ):
+            if total_size <= self.max_bytes:
+                break
+
+            to_delete.append((key,))
+            total_size -= size
+
+        self._db.executemany("DELETE FROM results WHERE key = ?", to_delete)
+
+    def size(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM results")
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspect or clear the result cache")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="Cache database")
+    parser.add_argument("--clear", action="store_true", help="Remove all entries")
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.path)
+
+    if args.clear:
+        cache.clear()
+
+    print(f"{args.path}: {len(cache)} entries, {cache.size()} bytes")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Empirical complexity of the daily solutions
+
+Every part runs on generated inputs of a geometric series of scales; the
+exponent `k` of `time ~ n^k` (`n` = input size in bytes) is the slope of the
+least-squares line through the (log n, log time) points. Parts whose exponent
+exceeds their declared target (`TARGETS`, `DEFAULT_TARGET` otherwise) by more
+than the tolerance are flagged.
+
+Usage: python -m aoc.complexity [DAY ...] [--min-scale S] [--factor F]
+                                [--steps N] [--repeat N] [--max-time SECONDS]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+from typing import Any
+
+from aoc.days import get_parts, list_days, load_day, normalize_day
+from aoc.generators import part_kwargs, write_input
+from aoc.runner import timed
+
+
+T_Fit = dict[str, Any]
+
+# Linear in the input size, unless declared otherwise below
+DEFAULT_TARGET = 1.0
+
+# Expected exponents of the parts that are inherently super-linear
+TARGETS: dict[str, float] = {
+    "day06/part_two": 1.5,  # A guard walk (~ side) per candidate cell (~ side^2)
+    "day18/part_two": 2.0,  # A BFS over the grid per fallen byte
+    "day25/part_one": 2.0,  # Every lock against every key
+}
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float | None:
+    """Slope of the least-squares line through the log-log points"""
+    if len(sizes) < 2:
+        return None
+
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(time, 1e-9)) for time in times]
+
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+
+    if var_x == 0:  # Generator ignores the scale
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+
+
+def measure_day(
+    day: str,
+    scales: list[float],
+    repeat: int,
+    max_time: float,
+    seed: int = 0,
+) -> dict[str, T_Fit]:
+    """Input sizes and min. wall times per part, up to the first too slow run"""
+    module = load_day(day)
+    parts = get_parts(day)
+    points = {name: {"sizes": [], "times": []} for name in parts}
+    active = set(parts)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            if not active:
+                break
+
+            file = write_input(day, tmp_dir, scale=scale, seed=seed)
+            size = os.path.getsize(file)
+            kwargs = part_kwargs(day, scale)
+
+            for name in sorted(active):
+                timings = []
+                for _ in range(repeat):
+                    data = module.read_input(file)
+                    _, timing = timed(parts[name], module, data, **kwargs)
+                    timings.append(timing["wall"])
+
+                points[name]["sizes"].append(size)
+                points[name]["times"].append(min(timings))
+
+                if min(timings) > max_time:
+                    active.discard(name)
+
+    return points
+
+
+def fit_day(day: str, points: dict[str, T_Fit], tolerance: float) -> dict[str, T_Fit]:
+    fits = {}
+
+    for name, part_points in points.items():
+        target = TARGETS.get(f"{day}/{name}", DEFAULT_TARGET)
+        exponent = fit_exponent(part_points["sizes"], part_points["times"])
+
+        fits[name] = {
+            **part_points,
+            "exponent": exponent,
+            "target": target,
+            "flagged": exponent is not None and exponent > target + tolerance,
+        }
+
+    return fits
+
+
+def format_report(results: dict[str, dict[str, T_Fit]]) -> str:
+    header = f"{'Part':<16} {'Sizes [B]':>21} {'Times [s]':>21} {'Exponent':>9} {'Target':>7}"
+    lines = [header, "-" * len(header)]
+
+    for day, fits in results.items():
+        for name, fit in fits.items():
+            if "error" in fit:
+                lines.append(f"{day + '/' + name:<16} {fit['error']}")
+                continue
+
+            sizes = f"{fit['sizes'][0]}..{fit['sizes'][-1]}" if fit["sizes"] else "-"
+            times = f"{fit['times'][0]:.4f}..{fit['times'][-1]:.4f}" if fit["times"] else "-"
+            exponent = f"{fit['exponent']:.2f}" if fit["exponent"] is not None else "n/a"
+
+            line = (
+                f"{day + '/' + name:<16} {sizes:>21} {times:>21} "
+                f"{exponent:>9} {fit['target']:>7.2f}"
+            )
+            if fit["flagged"]:
+                line += "  ABOVE TARGET"
+
+            lines.append(line)
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Fit the empirical complexity of the daily solutions")
+    parser.add_argument("days", nargs="*", help="Days to measure (default: all)")
+    parser.add_argument("--min-scale", type=float, default=0.25, help="Smallest scale (default: 0.25)")
+    parser.add_argument("--factor", type=float, default=2.0, help="Ratio of consecutive scales (default: 2)")
+    parser.add_argument("--steps", type=int, default=5, help="Number of scales (default: 5)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per point, the min. is used (default: 3)")
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=5.0,
+        help="Stop growing a part after a run slower than this [s] (default: 5)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed excess of the exponent over the target (default: 0.25)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    parser.add_argument("--json", default=None, help="Write the fits as JSON to the given file")
+    args = parser.parse_args(argv)
+
+    days = [normalize_day(day) for day in args.days] or list_days()
+    scales = [args.min_scale * args.factor ** step for step in range(args.steps)]
+
+    results = {}
+    for day in days:
+        try:
+            points = measure_day(day, scales, args.repeat, args.max_time, args.seed)
+            results[day] = fit_day(day, points, args.tolerance)
+        except Exception as exc:
+            results[day] = {"all": {"error": f"{type(exc).__name__}: {exc}"}}
+
+    print(format_report(results))
+
+    if args.json is not None:
+        with open(args.json, "w") as fout:
+            json.dump(results, fout, indent=2)
+
+    flagged = [
+        f"{day}/{name}"
+        for day, fits in results.items()
+        for name, fit in fits.items()
+        if fit.get("flagged")
+    ]
+    if flagged:
+        print(f"{len(flagged)} part(s) above their target: {', '.join(flagged)}")
+
+    return int(bool(flagged))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
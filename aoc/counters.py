@@ -0,0 +1,70 @@
+"""Operation counters of the hot loops (heap operations, expanded nodes, ...)
+
+Disabled by default, and then free: instead of checking a flag per
+operation, instrumented code either swaps in counting versions of its
+primitives when the counters get enabled (see `on_toggle`) or derives the
+counts from its final state after the loop (`if counters.ENABLED: ...` once
+per call). Set `AOC_COUNTERS=1` to enable them in every process, e.g. in the
+workers of `aoc.runner --counters -j N`.
+
+Long running parts also count their units of work (`day06.candidates`, ...)
+under the same guard. When a part runs with a time budget (see
+`aoc.runner --timeout`) the runner enables the counters in the part's own
+process and streams snapshots of them as progress, so a part that gets
+killed still reports how far it got.
+"""
+import os
+from collections import Counter
+from typing import Callable
+
+
+ENABLED = os.environ.get("AOC_COUNTERS") == "1"
+
+COUNTS: Counter[str] = Counter()
+
+_HOOKS: list[Callable[[bool], None]] = []
+
+
+def on_toggle(hook: Callable[[bool], None]) -> None:
+    """Call `hook(enabled)` now and whenever the counters are enabled/disabled"""
+    _HOOKS.append(hook)
+    hook(ENABLED)
+
+
+def _set_enabled(enabled: bool) -> None:
+    global ENABLED
+    ENABLED = enabled
+
+    for hook in _HOOKS:
+        hook(enabled)
+
+
+def enable() -> None:
+    os.environ["AOC_COUNTERS"] = "1"
+    _set_enabled(True)
+
+
+def disable() -> None:
+    os.environ.pop("AOC_COUNTERS", None)
+    _set_enabled(False)
+
+
+def add(name: str, n: int = 1) -> None:
+    COUNTS[name] += n
+
+
+def counted(fn: Callable, name: str) -> Callable:
+    """`fn` counting its calls as `name`"""
+    def wrapper(*args):
+        COUNTS[name] += 1
+        return fn(*args)
+
+    return wrapper
+
+
+def snapshot() -> dict[str, int]:
+    return dict(sorted(COUNTS.items()))
+
+
+def reset() -> None:
+    COUNTS.clear()
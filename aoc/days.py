@@ -0,0 +1,142 @@
+"""Discovery and loading of the dayNN solution modules"""
+import importlib.util
+import os
+import re
+from types import ModuleType
+from typing import Any, Callable
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Called as `part(module, data, **kwargs)`, the keyword arguments are
+# forwarded to the solution (e.g. `grid_size` for day18)
+T_Part = Callable[..., Any]
+
+PART_NAMES = ("part_one", "part_two")
+
+
+def _call(name: str, **defaults) -> T_Part:
+    def _part(module: ModuleType, data: Any, **kwargs) -> Any:
+        return getattr(module, name)(data, **{**defaults, **kwargs})
+
+    return _part
+
+
+# Most days expose `solve_part_one` / `solve_part_two`, the rest is listed
+# here. `None` means that the part is not runnable in batch (e.g. day14 part
+# two renders images for manual inspection).
+_PARTS: dict[str, tuple[T_Part | None, T_Part | None]] = {
+    "day01": (
+        _call("compute_sum_of_distances"),
+        _call("compute_similarity_score"),
+    ),
+    "day02": (
+        _call("count_safe_reports"),
+        _call("count_safe_reports_with_dampener"),
+    ),
+    "day03": (
+        _call("run_multiplications"),
+        _call("run_multiplications_with_conditionals"),
+    ),
+    "day04": (
+        _call("find_num_xmas"),
+        _call("find_num_crossed_mas"),
+    ),
+    "day13": (
+        lambda module, data, **kwargs: module.solve_part_one(data, module.solve_efficient),
+        _call("solve_part_two"),
+    ),
+    "day14": (
+        _call("solve_part_one", width=101, height=103),
+        None,
+    ),
+    "day17": (
+        lambda module, data, **kwargs: module.run_program(*data),
+        lambda module, data, **kwargs: module.solve_part_two(data[1]),
+    ),
+    "day25": (
+        _call("solve_part_one"),
+        None,
+    ),
+}
+
+_DEFAULT_PARTS = (_call("solve_part_one"), _call("solve_part_two"))
+
+REFERENCE = "reference"
+
+# Interchangeable implementations of a part: a (slow, obviously correct)
+# `REFERENCE` and the fast variants, cross-checked by `aoc.verify`
+_VARIANTS: dict[str, dict[str, dict[str, T_Part]]] = {
+    "day02": {
+        "part_one": {
+            REFERENCE: _call("count_safe_reports"),
+            "vectorized": _call("count_safe_reports_vectorized"),
+        },
+        "part_two": {
+            REFERENCE: lambda module, data, **kwargs: module.count_safe_reports_with_dampener(
+                data,
+                check=module.can_be_made_safe_naive,
+            ),
+            "linear": _call("count_safe_reports_with_dampener"),
+            "vectorized": _call("count_safe_reports_with_dampener_vectorized"),
+        },
+    },
+    "day04": {
+        "part_one": {
+            REFERENCE: _call("find_num_xmas"),
+            "aho_corasick": _call("find_num_xmas_aho_corasick"),
+        },
+    },
+    "day13": {
+        "part_one": {
+            REFERENCE: lambda module, data, **kwargs: module.solve_part_one(data, module.solve_naive),
+            "efficient": lambda module, data, **kwargs: module.solve_part_one(data, module.solve_efficient),
+        },
+    },
+}
+
+
+def list_days(root: str = ROOT_DIR) -> list[str]:
+    return sorted(
+        name
+        for name in os.listdir(root)
+        if re.fullmatch(r"day\d{2}", name)
+        and os.path.isfile(os.path.join(root, name, "main.py"))
+    )
+
+
+def normalize_day(day: str | int) -> str:
+    if isinstance(day, int) or day.isdigit():
+        return f"day{int(day):02d}"
+
+    if not re.fullmatch(r"day\d{2}", day):
+        raise ValueError(f"Unknown day: {day}")
+
+    return day
+
+
+def load_day(day: str, root: str = ROOT_DIR) -> ModuleType:
+    path = os.path.join(root, day, "main.py")
+    spec = importlib.util.spec_from_file_location(f"{day}_main", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_parts(day: str) -> dict[str, T_Part]:
+    parts = _PARTS.get(day, _DEFAULT_PARTS)
+
+    return {
+        name: part
+        for name, part in zip(PART_NAMES, parts)
+        if part is not None
+    }
+
+
+def get_variants(day: str) -> dict[str, dict[str, T_Part]]:
+    """Registered implementations per part, the reference first"""
+    return _VARIANTS.get(day, {})
+
+
+def input_path(day: str, input_name: str = "input.txt", root: str = ROOT_DIR) -> str:
+    return os.path.join(root, day, "data", input_name)
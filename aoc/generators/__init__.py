@@ -0,0 +1,38 @@
+"""Synthetic, deterministic inputs for every day
+
+Each `dayNN` module provides `generate(scale, seed) -> str` returning an input
+in the exact format of the puzzle. `scale=1` is roughly the size of a real
+puzzle input, `scale=10` makes the relevant dimension (grid side, number of
+reports, number of buyers, ...) ten times larger. Days whose solutions take
+size-dependent parameters additionally provide `part_kwargs(scale)`.
+"""
+import importlib
+import os
+from types import ModuleType
+from typing import Any
+
+
+def load_generator(day: str) -> ModuleType:
+    return importlib.import_module(f"aoc.generators.{day}")
+
+
+def generate(day: str, scale: float = 1, seed: int = 0) -> str:
+    return load_generator(day).generate(scale=scale, seed=seed)
+
+
+def part_kwargs(day: str, scale: float = 1) -> dict[str, Any]:
+    generator = load_generator(day)
+
+    if not hasattr(generator, "part_kwargs"):
+        return {}
+
+    return generator.part_kwargs(scale)
+
+
+def write_input(day: str, directory: str, scale: float = 1, seed: int = 0) -> str:
+    path = os.path.join(directory, f"{day}_scale{scale:g}_seed{seed}.txt")
+
+    with open(path, "w") as fout:
+        fout.write(generate(day, scale=scale, seed=seed))
+
+    return path
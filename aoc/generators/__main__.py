@@ -0,0 +1,30 @@
+"""Write a generated input to a file
+
+Usage: python -m aoc.generators DAY [--scale S] [--seed N] [-o FILE]
+"""
+import argparse
+import sys
+
+from aoc.days import normalize_day
+from aoc.generators import generate
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic input")
+    parser.add_argument("day", help="Day to generate the input for, e.g. `6`")
+    parser.add_argument("--scale", type=float, default=1, help="Size factor (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("-o", "--output", default=None, help="Output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    content = generate(normalize_day(args.day), scale=args.scale, seed=args.seed)
+
+    if args.output is None:
+        sys.stdout.write(content)
+    else:
+        with open(args.output, "w") as fout:
+            fout.write(content)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Helpers shared by the input generators"""
+import random
+
+
+def scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def make_rng(seed: int) -> random.Random:
+    return random.Random(seed)
+
+
+def random_maze(width: int, height: int, rng: random.Random) -> list[list[str]]:
+    """Perfect maze (`#` walls, `.` paths) carved on odd coordinates
+
+    Width and height should be odd, the border is always a wall.
+    """
+    grid = [["#"] * width for _ in range(height)]
+
+    start = (1, 1)
+    grid[1][1] = "."
+    stack = [start]
+
+    while stack:
+        x, y = stack[-1]
+
+        neighbors = [
+            (x + dx, y + dy)
+            for dx, dy in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < x + dx < width - 1
+            and 0 < y + dy < height - 1
+            and grid[y + dy][x + dx] == "#"
+        ]
+
+        if not neighbors:
+            stack.pop()
+            continue
+
+        nx, ny = rng.choice(neighbors)
+        grid[(y + ny) // 2][(x + nx) // 2] = "."
+        grid[ny][nx] = "."
+        stack.append((nx, ny))
+
+    return grid
+
+
+def odd(value: int) -> int:
+    return value if value % 2 == 1 else value + 1
+
+
+def to_text(lines: list[str]) -> str:
+    return "\n".join(lines) + "\n"
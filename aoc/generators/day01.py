@@ -0,0 +1,17 @@
+"""Day 01 input generator: pairs of location IDs"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_rows = scaled(1_000, scale)
+
+    # Right IDs are drawn from a smaller pool, so that the similarity score
+    # actually has repeated values to count
+    pool = [rng.randint(10_000, 99_999) for _ in range(max(1, num_rows // 4))]
+
+    return to_text([
+        f"{rng.choice(pool) if rng.random() < 0.5 else rng.randint(10_000, 99_999)}"
+        f"   {rng.choice(pool)}"
+        for _ in range(num_rows)
+    ])
@@ -0,0 +1,24 @@
+"""Day 02 input generator: reports of levels"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_reports = scaled(1_000, scale)
+
+    reports = []
+    for _ in range(num_reports):
+        sign = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        report = [level]
+
+        for _ in range(rng.randint(4, 7)):
+            if rng.random() < 0.1:  # Unsafe step
+                level += rng.choice((0, -sign, 4 * sign))
+            else:
+                level += sign * rng.randint(1, 3)
+            report.append(level)
+
+        reports.append(" ".join(str(level) for level in report))
+
+    return to_text(reports)
@@ -0,0 +1,34 @@
+"""Day 03 input generator: corrupted memory"""
+import string
+
+from aoc.generators.common import make_rng, scaled
+
+
+_NOISE = string.ascii_letters + string.digits + "!@#$%^&*()[]{}<>,;:'?/+- "
+
+_CORRUPTED = ["mul(", "mul[", "mul ( ", "do(", "don't", "mul(4*", "mul(6,9!", "?(12,34)"]
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    length = scaled(18_000, scale)
+
+    chunks = []
+    size = 0
+    while size < length:
+        r = rng.random()
+        if r < 0.6:
+            chunk = "".join(rng.choices(_NOISE, k=rng.randint(1, 12)))
+        elif r < 0.85:
+            chunk = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif r < 0.9:
+            chunk = "do()"
+        elif r < 0.95:
+            chunk = "don't()"
+        else:
+            chunk = rng.choice(_CORRUPTED)
+
+        chunks.append(chunk)
+        size += len(chunk)
+
+    return "".join(chunks)
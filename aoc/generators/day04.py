@@ -0,0 +1,12 @@
+"""Day 04 input generator: letter grid"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = scaled(140, scale)
+
+    return to_text([
+        "".join(rng.choices("XMAS", k=side))
+        for _ in range(side)
+    ])
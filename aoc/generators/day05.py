@@ -0,0 +1,32 @@
+"""Day 05 input generator: page ordering rules and updates"""
+from aoc.generators.common import make_rng, scaled
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_updates = scaled(200, scale)
+
+    # A total order over the pages, given as a rule for every pair
+    pages = rng.sample(range(10, 100), k=49)
+    rules = [
+        (a, b)
+        for i, a in enumerate(pages)
+        for b in pages[i + 1:]
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(num_updates):
+        update = rng.sample(pages, k=rng.randrange(5, 24, 2))
+
+        if rng.random() < 0.5:  # Correctly ordered
+            update.sort(key=pages.index)
+
+        updates.append(update)
+
+    raw_rules = "\n".join(f"{a}|{b}" for a, b in rules)
+    raw_updates = "\n".join(
+        ",".join(str(page) for page in update)
+        for update in updates
+    )
+    return f"{raw_rules}\n\n{raw_updates}\n"
@@ -0,0 +1,46 @@
+"""Day 06 input generator: lab map with a guard"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def _guard_path_length(grid: list[list[str]], x: int, y: int) -> int | None:
+    """Number of steps before the guard leaves the map (None for a loop)"""
+    width, height = len(grid[0]), len(grid)
+    dx, dy = 0, -1
+    seen = set()
+
+    while 0 <= x < width and 0 <= y < height:
+        if (x, y, dx, dy) in seen:
+            return None
+        seen.add((x, y, dx, dy))
+
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == "#":
+            dx, dy = -dy, dx
+            continue
+
+        x, y = nx, ny
+
+    return len(seen)
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = scaled(130, scale)
+
+    # A couple of obstacles per row - denser maps on large sides mostly trap
+    # the guard in a loop
+    density = min(0.05, 2 / side)
+
+    # Part one requires the guard to leave the map - retry until it does,
+    # after walking around for a while
+    while True:
+        grid = [
+            ["#" if rng.random() < density else "." for _ in range(side)]
+            for _ in range(side)
+        ]
+        x, y = rng.randrange(side), rng.randrange(side)
+        grid[y][x] = "^"
+
+        path_length = _guard_path_length(grid, x, y)
+        if path_length is not None and path_length >= side:
+            return to_text(["".join(line) for line in grid])
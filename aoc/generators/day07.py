@@ -0,0 +1,29 @@
+"""Day 07 input generator: calibration equations"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_equations = scaled(850, scale)
+
+    equations = []
+    for _ in range(num_equations):
+        numbers = [rng.randint(1, 99) for _ in range(rng.randint(2, 12))]
+
+        # Keep the results in the range of the real inputs (~15 digits)
+        result = numbers[0]
+        for num in numbers[1:]:
+            op = rng.choice("+*|")
+            if op == "*" and result * num < 10 ** 15:
+                result *= num
+            elif op == "|" and result * 100 < 10 ** 15:
+                result = int(f"{result}{num}")
+            else:
+                result += num
+
+        if rng.random() < 0.3:  # Most likely not solvable
+            result += rng.randint(1, 9)
+
+        equations.append(f"{result}: {' '.join(str(num) for num in numbers)}")
+
+    return to_text(equations)
@@ -0,0 +1,21 @@
+"""Day 08 input generator: antenna map"""
+import string
+
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+_FREQUENCIES = string.ascii_letters + string.digits
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = scaled(50, scale)
+    num_antennas = min(scaled(200, scale), side * side)
+
+    grid = [["."] * side for _ in range(side)]
+
+    for pos in rng.sample(range(side * side), k=num_antennas):
+        y, x = divmod(pos, side)
+        grid[y][x] = rng.choice(_FREQUENCIES)
+
+    return to_text(["".join(line) for line in grid])
@@ -0,0 +1,16 @@
+"""Day 09 input generator: disk map"""
+from aoc.generators.common import make_rng, scaled
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_files = scaled(10_000, scale)
+
+    digits = []
+    for idx in range(num_files):
+        digits.append(str(rng.randint(1, 9)))  # File
+
+        if idx < num_files - 1:
+            digits.append(str(rng.randint(0, 9)))  # Free space
+
+    return "".join(digits) + "\n"
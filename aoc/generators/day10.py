@@ -0,0 +1,16 @@
+"""Day 10 input generator: topographic map"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = scaled(45, scale)
+
+    # Diagonal slopes with some noise give plenty of hiking trails
+    return to_text([
+        "".join(
+            str((x + y + (rng.randint(-1, 1) if rng.random() < 0.2 else 0)) % 10)
+            for x in range(side)
+        )
+        for y in range(side)
+    ])
@@ -0,0 +1,12 @@
+"""Day 11 input generator: stones"""
+from aoc.generators.common import make_rng, scaled
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_stones = scaled(8, scale)
+
+    return " ".join(
+        str(rng.randint(0, 10_000_000))
+        for _ in range(num_stones)
+    )
@@ -0,0 +1,27 @@
+"""Day 12 input generator: garden plots"""
+import string
+
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = scaled(140, scale)
+    block = 5
+
+    # Coarse blocks of plants (keeps the regions small) with some noise
+    num_blocks = side // block + 1
+    blocks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(num_blocks)]
+        for _ in range(num_blocks)
+    ]
+
+    return to_text([
+        "".join(
+            rng.choice(string.ascii_uppercase)
+            if rng.random() < 0.05
+            else blocks[y // block][x // block]
+            for x in range(side)
+        )
+        for y in range(side)
+    ])
@@ -0,0 +1,51 @@
+"""Day 13 input generator: claw machines"""
+from aoc.generators.common import make_rng, scaled
+
+
+_OFFSET = 10_000_000_000_000
+
+
+def _solvable_with_offset(ax: int, ay: int, bx: int, by: int, rng) -> tuple[int, int]:
+    # Round the (real valued) number of presses for a random prize, which
+    # moves the prize by at most a few hundred
+    det = ax * by - bx * ay
+    if det == 0:
+        return rng.randint(1_000, 20_000), rng.randint(1_000, 20_000)
+
+    tx = _OFFSET + rng.randint(1_000, 20_000)
+    ty = _OFFSET + rng.randint(1_000, 20_000)
+    a = round((by * tx - bx * ty) / det)
+    b = round((ax * ty - ay * tx) / det)
+
+    px, py = a * ax + b * bx - _OFFSET, a * ay + b * by - _OFFSET
+    if a < 0 or b < 0 or px <= 0 or py <= 0:
+        return rng.randint(1_000, 20_000), rng.randint(1_000, 20_000)
+
+    return px, py
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_machines = scaled(320, scale)
+
+    machines = []
+    for _ in range(num_machines):
+        ax, ay = rng.randint(10, 99), rng.randint(10, 99)
+        bx, by = rng.randint(10, 99), rng.randint(10, 99)
+
+        kind = rng.randrange(3)
+        if kind == 0:  # Solvable within 100 presses
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        elif kind == 1:  # Solvable with the part two offset
+            px, py = _solvable_with_offset(ax, ay, bx, by, rng)
+        else:
+            px, py = rng.randint(1_000, 20_000), rng.randint(1_000, 20_000)
+
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={px}, Y={py}"
+        )
+
+    return "\n\n".join(machines) + "\n"
@@ -0,0 +1,13 @@
+"""Day 14 input generator: robots in a 101x103 area"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_robots = scaled(500, scale)
+
+    return to_text([
+        f"p={rng.randrange(101)},{rng.randrange(103)} "
+        f"v={rng.randint(-100, 100)},{rng.randint(-100, 100)}"
+        for _ in range(num_robots)
+    ])
@@ -0,0 +1,28 @@
+"""Day 15 input generator: warehouse and robot moves"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = scaled(50, scale)
+    num_moves = scaled(20_000, scale)
+
+    grid = []
+    for y in range(side):
+        line = []
+        for x in range(side):
+            if x in (0, side - 1) or y in (0, side - 1):
+                line.append("#")
+            else:
+                r = rng.random()
+                line.append("#" if r < 0.05 else "O" if r < 0.3 else ".")
+        grid.append(line)
+
+    rx, ry = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+    grid[ry][rx] = "@"
+
+    moves = "".join(rng.choices("<^>v", k=num_moves))
+
+    raw_map = to_text(["".join(line) for line in grid])
+    raw_moves = to_text([moves[i:i + 1000] for i in range(0, len(moves), 1000)])
+    return f"{raw_map}\n{raw_moves}"
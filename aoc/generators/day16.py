@@ -0,0 +1,19 @@
+"""Day 16 input generator: reindeer maze"""
+from aoc.generators.common import make_rng, odd, random_maze, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = odd(max(5, scaled(141, scale)))
+
+    grid = random_maze(side, side, rng)
+
+    # Open up some walls, so that there are multiple best paths
+    for _ in range(side * side // 50):
+        x, y = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        grid[y][x] = "."
+
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+
+    return to_text(["".join(line) for line in grid])
@@ -0,0 +1,53 @@
+"""Day 17 input generator: 3-bit computer program
+
+The program follows the usual puzzle template (output depends only on A,
+A is shifted by 3 bits per iteration), with the constants chosen such that
+part two has a solution. The input has no natural size, `scale` is unused.
+"""
+from aoc.generators.common import make_rng
+
+
+def _run(A: int, x: int, y: int) -> list[int]:
+    out = []
+    while True:
+        B = (A % 8) ^ x
+        C = A >> B
+        out.append((B ^ y ^ C) % 8)
+        A >>= 3
+        if A == 0:
+            return out
+
+
+def _has_quine(program: list[int], x: int, y: int) -> bool:
+    candidates = [0]
+
+    for idx in reversed(range(len(program))):
+        candidates = [
+            A * 8 + d
+            for A in candidates
+            for d in range(8)
+            if A * 8 + d > 0 and _run(A * 8 + d, x, y) == program[idx:]
+        ]
+
+    return len(candidates) > 0
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+
+    while True:
+        x, y, z = rng.randrange(8), rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, x, 7, 5, 1, y, 0, 3, 4, z, 5, 5, 3, 0]
+
+        if _has_quine(program, x, y):
+            break
+
+    A = rng.randrange(8 ** 15, 8 ** 16)
+
+    return (
+        f"Register A: {A}\n"
+        "Register B: 0\n"
+        "Register C: 0\n"
+        "\n"
+        f"Program: {','.join(str(p) for p in program)}\n"
+    )
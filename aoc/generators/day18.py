@@ -0,0 +1,29 @@
+"""Day 18 input generator: falling bytes"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def part_kwargs(scale: float) -> dict[str, int]:
+    grid_size = max(7, scaled(71, scale))
+    return {
+        "grid_size": grid_size,
+        "num_bytes": grid_size * grid_size // 5,
+    }
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    grid_size = part_kwargs(scale)["grid_size"]
+
+    cells = [
+        (x, y)
+        for y in range(grid_size)
+        for x in range(grid_size)
+        if (x, y) not in ((0, 0), (grid_size - 1, grid_size - 1))
+    ]
+    rng.shuffle(cells)
+
+    # About 2/3 of the cells (like the real input) - the exit is blocked well
+    # before that, while the first 1/5 keeps it reachable
+    num_falling = len(cells) * 2 // 3
+
+    return to_text([f"{x},{y}" for x, y in cells[:num_falling]])
@@ -0,0 +1,25 @@
+"""Day 19 input generator: towel patterns and designs"""
+from aoc.generators.common import make_rng, scaled
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_designs = scaled(400, scale)
+
+    towels = sorted({
+        "".join(rng.choices("wubrg", k=rng.randint(1, 8)))
+        for _ in range(450)
+    })
+
+    designs = []
+    for _ in range(num_designs):
+        if rng.random() < 0.7:  # Possible design
+            design = ""
+            while len(design) < 40:
+                design += rng.choice(towels)
+        else:
+            design = "".join(rng.choices("wubrg", k=rng.randint(20, 60)))
+
+        designs.append(design)
+
+    return ", ".join(towels) + "\n\n" + "\n".join(designs) + "\n"
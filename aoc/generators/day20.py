@@ -0,0 +1,44 @@
+"""Day 20 input generator: single-path racetrack"""
+from aoc.generators.common import make_rng, odd, random_maze, scaled, to_text
+
+
+def _path(grid: list[list[str]], start, end) -> list[tuple[int, int]]:
+    prev = {start: None}
+    stack = [start]
+
+    while stack:
+        x, y = stack.pop()
+        if (x, y) == end:
+            break
+
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nxt = (x + dx, y + dy)
+            if grid[nxt[1]][nxt[0]] != "#" and nxt not in prev:
+                prev[nxt] = (x, y)
+                stack.append(nxt)
+
+    path = []
+    pos = end
+    while pos is not None:
+        path.append(pos)
+        pos = prev[pos]
+
+    return path[::-1]
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    side = odd(max(5, scaled(141, scale)))
+
+    # Keep only the path between S and E of a perfect maze, i.e. a single track
+    maze = random_maze(side, side, rng)
+    start, end = (1, side - 2), (side - 2, 1)
+
+    grid = [["#"] * side for _ in range(side)]
+    for x, y in _path(maze, start, end):
+        grid[y][x] = "."
+
+    grid[start[1]][start[0]] = "S"
+    grid[end[1]][end[0]] = "E"
+
+    return to_text(["".join(line) for line in grid])
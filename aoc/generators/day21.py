@@ -0,0 +1,12 @@
+"""Day 21 input generator: door codes"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_codes = scaled(5, scale)
+
+    return to_text([
+        f"{rng.randint(1, 999):03d}A"
+        for _ in range(num_codes)
+    ])
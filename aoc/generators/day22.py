@@ -0,0 +1,12 @@
+"""Day 22 input generator: initial secret numbers of the buyers"""
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_buyers = scaled(2_000, scale)
+
+    return to_text([
+        str(rng.randint(1, 16_777_215))
+        for _ in range(num_buyers)
+    ])
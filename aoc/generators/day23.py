@@ -0,0 +1,51 @@
+"""Day 23 input generator: LAN party connections
+
+Computer names are two lowercase letters while there are enough of them
+(676), larger networks use longer names.
+"""
+import string
+from itertools import combinations, product
+
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+_GROUP_SIZE = 13
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_nodes = scaled(520, scale)
+
+    name_len = 2
+    while len(string.ascii_lowercase) ** name_len < num_nodes:
+        name_len += 1
+
+    names = [
+        "".join(chars)
+        for chars in product(string.ascii_lowercase, repeat=name_len)
+    ]
+    nodes = rng.sample(names, k=num_nodes)
+
+    edges = set()
+
+    # Dense groups, only the first one is a full clique (the LAN party)
+    for start in range(0, num_nodes, _GROUP_SIZE):
+        group = nodes[start:start + _GROUP_SIZE]
+        group_edges = list(combinations(group, 2))
+
+        if start > 0:
+            rng.shuffle(group_edges)
+            group_edges = group_edges[len(group) // 2:]
+
+        edges.update(group_edges)
+
+    # Sparse random connections between the groups
+    for _ in range(num_nodes):
+        a, b = rng.sample(nodes, k=2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+
+    edges = sorted(edges)
+    rng.shuffle(edges)
+
+    return to_text([f"{a}-{b}" for a, b in edges])
@@ -0,0 +1,60 @@
+"""Day 24 input generator: ripple-carry adder
+
+Intermediate wire names never contain a `z` (day24 detects the output wires
+by that letter). Bit indices are zero-padded to the same width, so that the
+output wires sort correctly for any number of bits.
+"""
+from itertools import product
+
+from aoc.generators.common import make_rng, scaled, to_text
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_bits = scaled(45, scale)
+    width = max(2, len(str(num_bits)))
+
+    letters = "abcdefghijklmnopqrstuvw"
+    name_len = 3
+    while len(letters) ** name_len < 5 * num_bits:
+        name_len += 1
+
+    names = iter(rng.sample(
+        ["".join(chars) for chars in product(letters, repeat=name_len)],
+        k=5 * num_bits,
+    ))
+
+    def _wire(prefix: str, idx: int) -> str:
+        return f"{prefix}{idx:0{width}d}"
+
+    gates = []
+    carry = None
+
+    for i in range(num_bits):
+        x, y, z = _wire("x", i), _wire("y", i), _wire("z", i)
+
+        if carry is None:  # Half adder
+            gates.append((x, "XOR", y, z))
+            carry = _wire("z", num_bits) if num_bits == 1 else next(names)
+            gates.append((x, "AND", y, carry))
+            continue
+
+        partial_sum, partial_carry, carry_and = next(names), next(names), next(names)
+        gates.append((x, "XOR", y, partial_sum))
+        gates.append((partial_sum, "XOR", carry, z))
+        gates.append((x, "AND", y, partial_carry))
+        gates.append((partial_sum, "AND", carry, carry_and))
+
+        carry = _wire("z", num_bits) if i == num_bits - 1 else next(names)
+        gates.append((partial_carry, "OR", carry_and, carry))
+
+    rng.shuffle(gates)
+
+    wires = [
+        f"{_wire(prefix, i)}: {rng.randint(0, 1)}"
+        for prefix in ("x", "y")
+        for i in range(num_bits)
+    ]
+    raw_gates = [f"{w1} {gtype} {w2} -> {out}" for w1, gtype, w2, out in gates]
+
+    return to_text(wires) + "\n" + to_text(raw_gates)
@@ -0,0 +1,23 @@
+"""Day 25 input generator: lock and key schematics"""
+from aoc.generators.common import make_rng, scaled
+
+
+def _schematic(heights: list[int], is_lock: bool) -> str:
+    rows = []
+    for row in range(7):
+        level = row if is_lock else 6 - row
+        rows.append("".join("#" if level <= h else "." for h in heights))
+
+    return "\n".join(rows)
+
+
+def generate(scale: float = 1, seed: int = 0) -> str:
+    rng = make_rng(seed)
+    num_schematics = scaled(500, scale)
+
+    blocks = []
+    for _ in range(num_schematics):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        blocks.append(_schematic(heights, is_lock=rng.random() < 0.5))
+
+    return "\n\n".join(blocks) + "\n"
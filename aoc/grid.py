@@ -0,0 +1,174 @@
+"""2-D character grid backed by a contiguous uint8 buffer"""
+import pickle
+from typing import Iterator
+
+import numpy as np
+
+from aoc.loader import read_grid
+
+
+T_Position = tuple[int, int]
+
+DELTAS_4: tuple[T_Position, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DELTAS_8: tuple[T_Position, ...] = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0), (1, 0),
+    (-1, 1), (0, 1), (1, 1),
+)
+
+
+class Grid:
+    """
+    One byte per cell, row-major. `buffer` (bytearray) and `cells` (2-D NumPy
+    view of the same memory, indexed as `cells[y, x]`) are always in sync -
+    use the buffer for scalar access in hot loops (cheap `int` per cell) and
+    `cells` for vectorized passes.
+    """
+
+    def __init__(self, buffer: bytes | bytearray, width: int):
+        self._attach(bytearray(buffer), width)
+
+    def _attach(self, buffer: bytearray, width: int) -> None:
+        self.buffer = buffer
+        self.width = width
+        self.height = len(self.buffer) // width
+        self.cells = np.frombuffer(self.buffer, dtype=np.uint8).reshape(
+            self.height,
+            self.width,
+        )
+
+    @classmethod
+    def _adopt(cls, buffer: bytearray, width: int) -> "Grid":
+        """Grid on `buffer` itself, no copy (for unpickling)"""
+        grid = cls.__new__(cls)
+        grid._attach(buffer if isinstance(buffer, bytearray) else bytearray(buffer), width)
+        return grid
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> "Grid":
+        width = len(lines[0])
+        if any(len(line) != width for line in lines):
+            raise ValueError("Grid: all lines must have the same length")
+
+        return cls("".join(lines).encode("ascii"), width)
+
+    @classmethod
+    def from_array(cls, cells: np.ndarray) -> "Grid":
+        return cls(np.ascontiguousarray(cells, dtype=np.uint8).tobytes(), cells.shape[1])
+
+    @classmethod
+    def from_file(cls, file: str) -> "Grid":
+        return cls.from_array(read_grid(file))
+
+    @classmethod
+    def filled(cls, width: int, height: int, value: str) -> "Grid":
+        return cls(value.encode("ascii") * (width * height), width)
+
+    def __getitem__(self, pos: T_Position) -> str:
+        x, y = pos
+        return chr(self.buffer[y * self.width + x])
+
+    def __setitem__(self, pos: T_Position, value: str) -> None:
+        x, y = pos
+        self.buffer[y * self.width + x] = ord(value)
+
+    def __reduce_ex__(self, protocol: int):
+        # Protocol 5 pickles the buffer out-of-band when the pickler takes a
+        # `buffer_callback` (see `aoc.parsecache`), the unpickled grid adopts it
+        if protocol >= 5:
+            return Grid._adopt, (pickle.PickleBuffer(self.buffer), self.width)
+
+        return Grid, (bytes(self.buffer), self.width)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Grid)
+            and self.width == other.width
+            and self.buffer == other.buffer
+        )
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self.width}, height={self.height})"
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def copy(self) -> "Grid":
+        return Grid(self.buffer, self.width)
+
+    def lines(self) -> list[str]:
+        raw = self.buffer.decode("ascii")
+        return [
+            raw[start:start + self.width]
+            for start in range(0, len(raw), self.width)
+        ]
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def position(self, idx: int) -> T_Position:
+        y, x = divmod(idx, self.width)
+        return x, y
+
+    def positions(self) -> Iterator[T_Position]:
+        for y in range(self.height):
+            for x in range(self.width):
+                yield x, y
+
+    def neighbors(
+        self,
+        x: int,
+        y: int,
+        deltas: tuple[T_Position, ...] = DELTAS_4,
+    ) -> Iterator[T_Position]:
+        width, height = self.width, self.height
+
+        for dx, dy in deltas:
+            new_x, new_y = x + dx, y + dy
+            if 0 <= new_x < width and 0 <= new_y < height:
+                yield new_x, new_y
+
+    def flat_neighbors(
+        self,
+        idx: int,
+        deltas: tuple[T_Position, ...] = DELTAS_4,
+    ) -> Iterator[int]:
+        y, x = divmod(idx, self.width)
+
+        for new_x, new_y in self.neighbors(x, y, deltas):
+            yield new_y * self.width + new_x
+
+    def mask(self, values: str) -> np.ndarray:
+        """Boolean array (indexed [y, x]) of cells equal to any of `values`"""
+        codes = np.frombuffer(values.encode("ascii"), dtype=np.uint8)
+        return np.isin(self.cells, codes)
+
+    def find(self, values: str) -> list[T_Position]:
+        """Positions of all the cells equal to any of `values` (row-major order)"""
+        ys, xs = np.nonzero(self.mask(values))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def find_one(self, value: str) -> T_Position:
+        idx = self.buffer.find(value.encode("ascii"))
+        if idx == -1:
+            raise ValueError(f"Grid: value {value!r} not found")
+
+        return self.position(idx)
+
+    def shifted(self, dx: int, dy: int, fill: int = 0) -> np.ndarray:
+        """Array `out` with `out[y, x] == cells[y + dy, x + dx]` (`fill` if outside)"""
+        out = np.full_like(self.cells, fill)
+
+        if abs(dx) >= self.width or abs(dy) >= self.height:
+            return out
+
+        src_y = slice(max(dy, 0), self.height + min(dy, 0))
+        src_x = slice(max(dx, 0), self.width + min(dx, 0))
+        dst_y = slice(max(-dy, 0), self.height + min(-dy, 0))
+        dst_x = slice(max(-dx, 0), self.width + min(-dx, 0))
+
+        out[dst_y, dst_x] = self.cells[src_y, src_x]
+        return out
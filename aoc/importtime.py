@@ -0,0 +1,121 @@
+"""Import cost of the daily solutions
+
+Every day is loaded in a fresh interpreter with `-X importtime`, after
+`import aoc.runner` - the cost of a day is the cumulative time of the
+modules it imports on top of the runner's own imports (the caches, profilers,
+...), which are already loaded when the runner loads a day. The numbers
+don't depend on which days were loaded before.
+
+Usage: python -m aoc.importtime [DAY ...] [--budget MS] [--top N]
+"""
+import argparse
+import subprocess
+import sys
+from typing import Any
+
+from aoc.days import ROOT_DIR, list_days, normalize_day
+
+
+T_ImportTime = dict[str, Any]
+
+_BASELINE_CODE = "import aoc.runner"
+_DAY_CODE = _BASELINE_CODE + "; from aoc.days import load_day; load_day({day!r})"
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """Cumulative import time (seconds) of every top-level import"""
+    modules = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit() or name.startswith("  "):
+            continue  # Header or nested import
+
+        modules[name.strip()] = int(cumulative) / 1e6
+
+    return modules
+
+
+def _profile_imports(code: str) -> dict[str, float]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+
+    if proc.returncode != 0:
+        raise ImportError(proc.stderr.strip().splitlines()[-1])
+
+    return parse_importtime(proc.stderr)
+
+
+def import_time(day: str, baseline: dict[str, float] | None = None) -> T_ImportTime:
+    """Total import time of the day and the per-module breakdown (slowest first)"""
+    if baseline is None:
+        baseline = _profile_imports(_BASELINE_CODE)
+
+    try:
+        day_modules = _profile_imports(_DAY_CODE.format(day=day))
+    except ImportError as exc:
+        return {"total": 0.0, "modules": {}, "error": str(exc)}
+
+    modules = {
+        name: seconds
+        for name, seconds in day_modules.items()
+        if name not in baseline
+    }
+    modules = dict(sorted(modules.items(), key=lambda item: item[1], reverse=True))
+
+    return {"total": sum(modules.values()), "modules": modules}
+
+
+def import_times(days: list[str]) -> dict[str, T_ImportTime]:
+    baseline = _profile_imports(_BASELINE_CODE)
+    return {day: import_time(day, baseline) for day in days}
+
+
+def format_modules(modules: dict[str, float], top: int = 3) -> str:
+    return ", ".join(
+        f"{name} {seconds * 1000:.1f}ms"
+        for name, seconds in list(modules.items())[:top]
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure import cost of the daily solutions")
+    parser.add_argument("days", nargs="*", help="Days to measure (default: all)")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Fail if a day takes longer than this many milliseconds to import",
+    )
+    parser.add_argument("--top", type=int, default=3, help="Modules shown per day (default: 3)")
+    args = parser.parse_args(argv)
+
+    days = [normalize_day(day) for day in args.days] or list_days()
+
+    failed = []
+    for day, cost in import_times(days).items():
+        if "error" in cost:
+            print(f"{day:<6} {'-':>11}  {cost['error']}")
+            failed.append(day)
+            continue
+
+        line = f"{day:<6} {cost['total'] * 1000:>9.1f}ms  {format_modules(cost['modules'], args.top)}"
+
+        if args.budget is not None and cost["total"] * 1000 > args.budget:
+            failed.append(day)
+            line += "  OVER BUDGET"
+
+        print(line)
+
+    return int(bool(failed))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
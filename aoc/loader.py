@@ -0,0 +1,182 @@
+"""Bulk input loading: memory-mapped raw bytes and vectorized parsers
+
+The parsers work on any bytes-like object (bytes, mmap, memoryview) without
+decoding it to `str` first, and scan integers with NumPy instead of
+`str.split` + `int()` per token.
+"""
+import mmap
+from typing import Iterator
+
+import numpy as np
+
+
+# Integers with more digits do not fit into int64
+MAX_DIGITS = 18
+
+# Inputs are parsed in chunks of this many bytes to bound the temporaries
+CHUNK_SIZE = 256 * 1024
+
+_POWERS_OF_TEN = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+
+_NEWLINE = ord("\n")
+_CARRIAGE_RETURN = ord("\r")
+_MINUS = ord("-")
+
+
+def map_file(file: str) -> mmap.mmap | bytes:
+    """Read-only memory map of the whole file (`b""` for an empty file)"""
+    with open(file, "rb") as fin:
+        try:
+            return mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            return b""
+
+
+def as_array(raw) -> np.ndarray:
+    """Zero-copy uint8 view of a bytes-like object"""
+    return np.frombuffer(raw, dtype=np.uint8)
+
+
+def _chunks(buf: np.ndarray, chunk_size: int) -> Iterator[tuple[int, np.ndarray]]:
+    """Split (offset, chunk) pairs such that no number is cut in half"""
+    start = 0
+    while start < len(buf):
+        end = min(start + chunk_size, len(buf))
+
+        while end < len(buf) and ord("0") <= buf[end] <= ord("9"):
+            end += 1
+
+        yield start, buf[start:end]
+        start = end
+
+
+def _parse_spans(buf: np.ndarray, signed: bool) -> tuple[np.ndarray, np.ndarray]:
+    """Values and start offsets of all the integers in the buffer"""
+    is_digit = (buf >= ord("0")) & (buf <= ord("9"))
+
+    padded = np.concatenate(([False], is_digit, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    starts, ends = edges[0::2], edges[1::2]
+
+    if len(starts) == 0:
+        return np.empty(0, dtype=np.int64), starts
+
+    lengths = ends - starts
+    if lengths.max() > MAX_DIGITS:
+        raise ValueError(f"parse_ints: integer with more than {MAX_DIGITS} digits")
+
+    # Every digit is weighted by 10 ** (its position from the end of its number)
+    digits = buf[is_digit].astype(np.int64) - ord("0")
+    number_ends = np.repeat(np.cumsum(lengths), lengths)
+    powers = number_ends - np.arange(len(digits)) - 1
+
+    values = np.add.reduceat(
+        digits * _POWERS_OF_TEN[powers],
+        np.cumsum(lengths) - lengths,
+    )
+
+    if signed:
+        has_prefix = starts > 0
+        negative = np.zeros_like(has_prefix)
+        negative[has_prefix] = buf[starts[has_prefix] - 1] == _MINUS
+        values[negative] *= -1
+
+    return values, starts
+
+
+def iter_ints(raw, signed: bool = True, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """The integers of `parse_ints`, as one int64 array per chunk"""
+    for _, chunk in _chunks(as_array(raw), chunk_size):
+        yield _parse_spans(chunk, signed)[0]
+
+
+def parse_ints(raw, signed: bool = True, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+    """All the integers in a bytes-like object, as int64 array
+
+    Any non-digit character is a separator, a `-` directly in front of a
+    number makes it negative (unless `signed=False`).
+    """
+    parts = list(iter_ints(raw, signed, chunk_size))
+
+    if not parts:
+        return np.empty(0, dtype=np.int64)
+
+    return np.concatenate(parts)
+
+
+def parse_int_rows(
+    raw,
+    signed: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """All the integers, grouped by line (CSR layout)
+
+    Returns `(values, offsets)`, where the numbers of line `i` are
+    `values[offsets[i]:offsets[i + 1]]`.
+    """
+    buf = as_array(raw)
+
+    values, starts = [], []
+    for offset, chunk in _chunks(buf, chunk_size):
+        chunk_values, chunk_starts = _parse_spans(chunk, signed)
+        values.append(chunk_values)
+        starts.append(chunk_starts + offset)
+
+    newlines = np.flatnonzero(buf == _NEWLINE)
+    num_lines = len(newlines) + int(len(buf) > 0 and buf[-1] != _NEWLINE)
+
+    if not values:
+        return np.empty(0, dtype=np.int64), np.zeros(num_lines + 1, dtype=np.int64)
+
+    values, starts = np.concatenate(values), np.concatenate(starts)
+
+    line_idxs = np.searchsorted(newlines, starts)
+    counts = np.bincount(line_idxs, minlength=num_lines)
+
+    offsets = np.zeros(num_lines + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    return values, offsets
+
+
+def parse_grid(raw) -> np.ndarray:
+    """2-D uint8 view (rows x columns) of a rectangular text grid, no copy
+
+    Lines end with `\n` or `\r\n` (then the row stride skips both bytes).
+    """
+    buf = as_array(raw)
+
+    # Ignore trailing newlines / whitespace
+    end = len(buf)
+    while end > 0 and buf[end - 1] in b"\r\n ":
+        end -= 1
+    buf = buf[:end]
+
+    newlines = np.flatnonzero(buf == _NEWLINE)
+    is_crlf = len(newlines) > 0 and newlines[0] > 0 and buf[newlines[0] - 1] == _CARRIAGE_RETURN
+    terminator = 2 if is_crlf else 1
+
+    width = int(newlines[0]) - (terminator - 1) if len(newlines) else len(buf)
+    height = len(newlines) + 1
+
+    if len(buf) != height * (width + terminator) - terminator:
+        raise ValueError("parse_grid: all lines must have the same length")
+
+    return np.lib.stride_tricks.as_strided(
+        buf,
+        shape=(height, width),
+        strides=(width + terminator, 1),
+        writeable=False,
+    )
+
+
+def read_ints(file: str, signed: bool = True) -> np.ndarray:
+    return parse_ints(map_file(file), signed=signed)
+
+
+def read_int_rows(file: str, signed: bool = True) -> tuple[np.ndarray, np.ndarray]:
+    return parse_int_rows(map_file(file), signed=signed)
+
+
+def read_grid(file: str) -> np.ndarray:
+    return parse_grid(map_file(file))
@@ -0,0 +1,105 @@
+"""Memory usage of single parts
+
+`tracemalloc` gives the exact peak of the memory allocated by Python and
+NumPy during the part. A background thread samples the resident set size of
+the process (`/proc/self/statm`, Linux only) and takes tracemalloc snapshots
+whenever the traced memory grows, so the reported allocation sites are the
+ones alive close to the peak, not the ones left over at the end.
+"""
+import os
+import threading
+import tracemalloc
+from typing import Any, Callable
+
+from aoc.profiling import short_path
+
+
+SAMPLE_INTERVAL = 0.005
+
+# Take a new snapshot only after the traced memory grew by this factor
+_SNAPSHOT_GROWTH = 1.25
+
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+def rss() -> int | None:
+    """Current resident set size in bytes (`None` if not available)"""
+    try:
+        with open("/proc/self/statm", "r") as fin:
+            return int(fin.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class MemorySampler(threading.Thread):
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.rss_peak = rss()
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_size = 0
+        self._stop_event = threading.Event()
+
+    def sample(self) -> None:
+        current_rss = rss()
+        if current_rss is not None:
+            self.rss_peak = max(self.rss_peak, current_rss)
+
+        current, _ = tracemalloc.get_traced_memory()
+        if current > _SNAPSHOT_GROWTH * self._snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, n: int) -> list[str]:
+    """The `n` source lines with the most allocated memory, formatted for the console"""
+    stats = snapshot.filter_traces(_FILTERS).statistics("lineno")
+
+    return [
+        f"{stat.size / 2**20:>10.2f} {stat.count:>10}  "
+        f"{short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}"
+        for stat in stats[:n]
+    ]
+
+
+def measured(
+    fn: Callable,
+    *args,
+    top: int = 10,
+    interval: float = SAMPLE_INTERVAL,
+    **kwargs,
+) -> tuple[Any, dict[str, Any]]:
+    """Result of the call and its memory usage (in bytes)"""
+    rss_start = rss()
+    sampler = MemorySampler(interval)
+
+    tracemalloc.start()
+    sampler.start()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        sampler.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    usage = {
+        "peak": peak,
+        "rss_start": rss_start,
+        "rss_peak": sampler.rss_peak,
+        "top": top_sites(sampler.snapshot, top) if sampler.snapshot is not None else [],
+    }
+    return result, usage
@@ -0,0 +1,151 @@
+"""Parse-once cache of decoded inputs
+
+`read_input` results are pickled (protocol 5, large buffers such as NumPy
+arrays out-of-band, i.e. stored raw after the pickle stream) into one file
+per input. The key covers the input (path, mtime, size), the source of the
+day's `read_input` and of the `aoc` helpers the day uses, so editing either
+invalidates the entry. Inputs that can't be pickled are simply not cached.
+
+Usage: python -m aoc.parsecache [--clear] [--directory DIR]
+"""
+import argparse
+import hashlib
+import inspect
+import os
+import pickle
+import struct
+from types import ModuleType
+from typing import Any
+
+from aoc.cache import source_files
+from aoc.days import ROOT_DIR
+
+
+DEFAULT_DIRECTORY = os.path.join(ROOT_DIR, ".cache", "inputs")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# File layout: magic, number of buffers, pickle length, buffer lengths,
+# the pickle stream, the buffers
+_MAGIC = b"AOCP"
+_HEADER = struct.Struct("<4sIQ")
+_LENGTH = struct.Struct("<Q")
+
+_code_hashes: dict[str, str] = {}
+
+
+def _code_hash(module: ModuleType) -> str:
+    if module.__name__ not in _code_hashes:
+        digest = hashlib.sha256(inspect.getsource(module.read_input).encode())
+
+        for file in sorted(source_files(module) - {inspect.getfile(module)}):
+            with open(file, "rb") as fin:
+                digest.update(fin.read())
+
+        _code_hashes[module.__name__] = digest.hexdigest()
+
+    return _code_hashes[module.__name__]
+
+
+def input_key(module: ModuleType, file: str) -> str:
+    stat = os.stat(file)
+    parts = [os.path.abspath(file), str(stat.st_mtime_ns), str(stat.st_size), _code_hash(module)]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def dump(obj: Any, file: str) -> None:
+    buffers = []
+    stream = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    tmp_file = f"{file}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as fout:
+        fout.write(_HEADER.pack(_MAGIC, len(raw_buffers), len(stream)))
+        for raw in raw_buffers:
+            fout.write(_LENGTH.pack(raw.nbytes))
+
+        fout.write(stream)
+        for raw in raw_buffers:
+            fout.write(raw)
+
+    os.replace(tmp_file, file)  # Atomic, concurrent readers never see a partial file
+
+
+def load(file: str) -> Any:
+    with open(file, "rb") as fin:
+        magic, num_buffers, stream_length = _HEADER.unpack(fin.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"Not a parse cache file: {file}")
+
+        lengths = [
+            _LENGTH.unpack(fin.read(_LENGTH.size))[0]
+            for _ in range(num_buffers)
+        ]
+        stream = fin.read(stream_length)
+
+        # Writable copies - the days may modify their input in place
+        buffers = [bytearray(fin.read(length)) for length in lengths]
+
+    return pickle.loads(stream, buffers=buffers)
+
+
+def _evict(directory: str, max_bytes: int) -> None:
+    entries = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        stat = os.stat(path)
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):  # Least recently used first
+        if total_size <= max_bytes:
+            break
+
+        os.remove(path)
+        total_size -= size
+
+
+def read_input(
+    module: ModuleType,
+    file: str,
+    directory: str = DEFAULT_DIRECTORY,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Any:
+    """`module.read_input(file)`, from the cache if the input was parsed before"""
+    path = os.path.join(directory, input_key(module, file) + ".pkl")
+
+    try:
+        data = load(path)
+        os.utime(path)  # Mark as recently used
+        return data
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError, struct.error):
+        pass
+
+    data = module.read_input(file)
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        dump(data, path)
+        _evict(directory, max_bytes)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        pass  # Not picklable
+
+    return data
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspect or clear the parse cache")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="Cache directory")
+    parser.add_argument("--clear", action="store_true", help="Remove all entries")
+    args = parser.parse_args(argv)
+
+    if args.clear and os.path.isdir(args.directory):
+        _evict(args.directory, max_bytes=0)
+
+    names = os.listdir(args.directory) if os.path.isdir(args.directory) else []
+    size = sum(os.path.getsize(os.path.join(args.directory, name)) for name in names)
+    print(f"{args.directory}: {len(names)} entries, {size} bytes")
+
+
+if __name__ == "__main__":
+    main()
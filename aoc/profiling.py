@@ -0,0 +1,129 @@
+"""Profiling of single parts
+
+A part runs under `cProfile` (exact call counts and times, stored as
+`.pstats`) while a background thread samples its call stack, which gives
+full stacks in the collapsed format of flamegraph.pl / speedscope
+(`frame;frame;frame count` per line).
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable
+
+from aoc.days import ROOT_DIR
+
+
+SAMPLE_INTERVAL = 0.001
+
+
+def short_path(file: str) -> str:
+    """Repository files relative to its root, others (stdlib, packages) by name"""
+    if file.startswith(ROOT_DIR + os.sep):
+        return os.path.relpath(file, ROOT_DIR)
+
+    return os.path.basename(file)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler(threading.Thread):
+    """Counts the stacks of a thread, below (excluding) the `root` frame"""
+
+    def __init__(self, thread_id: int, root: FrameType, interval: float = SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+
+            stack = []
+            while frame is not None and frame is not self.root:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+
+            # The outermost frame is the profiler's `runcall`
+            if frame is self.root and len(stack) > 1:
+                self.stacks[";".join(reversed(stack[:-1]))] += 1
+
+    def stop(self) -> Counter[str]:
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+def profiled(
+    fn: Callable,
+    *args,
+    interval: float = SAMPLE_INTERVAL,
+    **kwargs,
+) -> tuple[Any, cProfile.Profile, Counter[str]]:
+    """Result of the call, its profile and the sampled (collapsed) stacks"""
+    sampler = StackSampler(threading.get_ident(), sys._getframe(), interval)
+    profiler = cProfile.Profile()
+
+    # The sampler only runs when the part releases the GIL - without more
+    # frequent switches it would see mostly the (GIL releasing) NumPy calls
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(interval / 10)
+
+    sampler.start()
+    try:
+        result = profiler.runcall(fn, *args, **kwargs)
+    finally:
+        stacks = sampler.stop()
+        sys.setswitchinterval(switch_interval)
+
+    return result, profiler, stacks
+
+
+def top_functions(profiler: cProfile.Profile, n: int) -> list[str]:
+    """The `n` functions with the highest own time, formatted for the console"""
+    stats = pstats.Stats(profiler)
+
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+
+    lines = []
+    for (file, line, name), (_, num_calls, own_time, cumulative_time, _) in rows[:n]:
+        if file != "~":
+            name = f"{name} ({short_path(file)}:{line})"
+
+        lines.append(f"{own_time:>10.4f} {cumulative_time:>9.4f} {num_calls:>10}  {name}")
+
+    return lines
+
+
+def save_profile(
+    profiler: cProfile.Profile,
+    stacks: Counter[str],
+    directory: str,
+    name: str,
+    top: int = 10,
+) -> dict[str, Any]:
+    """Writes `<name>.pstats` and `<name>.collapsed`, returns their paths and the top functions"""
+    os.makedirs(directory, exist_ok=True)
+
+    pstats_file = os.path.join(directory, f"{name}.pstats")
+    profiler.dump_stats(pstats_file)
+
+    collapsed_file = os.path.join(directory, f"{name}.collapsed")
+    with open(collapsed_file, "w") as fout:
+        for stack, count in sorted(stacks.items()):
+            fout.write(f"{stack} {count}\n")
+
+    return {
+        "pstats": pstats_file,
+        "collapsed": collapsed_file,
+        "top": top_functions(profiler, top),
+    }
@@ -0,0 +1,745 @@
+"""Run (and time) all the daily solutions
+
+Answers are cached by the content of the input and the code (see
+`aoc.cache`), cached parts are marked in the report; parsed inputs are cached
+as well (`aoc.parsecache`). Use `--no-cache` to measure everything from
+scratch.
+
+Usage: python -m aoc.runner [DAY ...] [--input NAME] [--json FILE]
+                            [--jobs N] [--timings FILE]
+                            [--no-cache] [--cache-path FILE] [--cache-size MB]
+                            [--import-time] [--profile [DIR] | --memory] [--top N]
+                            [--timeout SECONDS] [--budget DAY[/PART]=SECONDS ...]
+                            [--counters]
+
+With a time budget every part runs in its own process, which is killed once
+the part itself (not the imports and parsing before it) exhausted the
+budget; timeouts are reported separately from errors, together with the
+operation counters (see `aoc.counters`) the part reached.
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, Callable
+
+from aoc import counters, parsecache
+from aoc.cache import DEFAULT_MAX_BYTES, DEFAULT_PATH, MISSING, ResultCache
+from aoc.days import get_parts, input_path, list_days, load_day, normalize_day
+from aoc.importtime import format_modules, import_times
+from aoc.memory import measured
+from aoc.profiling import profiled, save_profile
+
+
+T_Timing = dict[str, float]
+T_DayResult = dict[str, Any]
+
+# Seconds per part, keyed by `dayNN/part`, `dayNN` or `DEFAULT_BUDGET`
+T_Budgets = dict[str, float]
+
+DEFAULT_BUDGET = "default"
+
+# How often a part with a budget reports its counters [s]
+PROGRESS_INTERVAL = 0.1
+
+
+def timed(fn: Callable, *args, **kwargs) -> tuple[Any, T_Timing]:
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+    # Some days print debug information - keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn(*args, **kwargs)
+
+    timing = {
+        "wall": time.perf_counter() - wall_start,
+        "cpu": time.process_time() - cpu_start,
+    }
+    return result, timing
+
+
+def _run_parts(
+    day: str,
+    file: str,
+    part_names: list[str],
+    cache: ResultCache | None,
+    result: T_DayResult,
+    profile_dir: str | None = None,
+    top: int = 10,
+    memory: bool = False,
+    on_start: Callable[[], None] | None = None,
+) -> None:
+    """
+    Fill in `result` - the input is parsed only if some part is not cached.
+    `on_start()` is called right before each part is computed.
+    """
+    module = load_day(day)
+    parts = get_parts(day)
+    data = None
+
+    for name in part_names:
+        if cache is not None:
+            key = cache.key(module, name, file)
+            answer, timing = timed(cache.get, key)
+
+            if answer is not MISSING:
+                result["parts"][name] = {**timing, "answer": answer, "cached": True}
+                continue
+
+        if data is None:
+            if cache is None:
+                data, result["parse"] = timed(module.read_input, file)
+            else:
+                data, result["parse"] = timed(parsecache.read_input, module, file)
+
+        counters.reset()
+
+        if on_start is not None:
+            on_start()
+
+        if profile_dir is not None:
+            (answer, profiler, stacks), timing = timed(profiled, parts[name], module, data)
+            result["parts"][name] = {
+                **timing,
+                "answer": str(answer),
+                "profile": save_profile(profiler, stacks, profile_dir, f"{day}_{name}", top),
+            }
+        elif memory:
+            (answer, usage), timing = timed(measured, parts[name], module, data, top=top)
+            result["parts"][name] = {**timing, "answer": str(answer), "memory": usage}
+        else:
+            answer, timing = timed(parts[name], module, data)
+            result["parts"][name] = {**timing, "answer": str(answer)}
+
+        if counters.ENABLED:
+            result["parts"][name]["counters"] = counters.snapshot()
+
+        if cache is not None:
+            cache.put(key, str(answer))
+
+
+def run_day(
+    day: str,
+    input_name: str = "input.txt",
+    cache: ResultCache | None = None,
+    profile_dir: str | None = None,
+    top: int = 10,
+    memory: bool = False,
+) -> T_DayResult:
+    file = input_path(day, input_name)
+    result = {"day": day, "input": file, "status": "ok", "parts": {}}
+
+    if not os.path.isfile(file):
+        result["status"] = "skipped"
+        result["error"] = f"Input not found: {file}"
+        return result
+
+    try:
+        _run_parts(
+            day,
+            file,
+            list(get_parts(day)),
+            cache,
+            result,
+            profile_dir,
+            top,
+            memory,
+        )
+    except Exception as exc:
+        result["status"] = "error"
+        result["error"] = f"{type(exc).__name__}: {exc}"
+
+    return result
+
+
+def run_part(
+    day: str,
+    part_name: str,
+    input_name: str = "input.txt",
+    cache_path: str | None = None,
+    cache_size: int = DEFAULT_MAX_BYTES,
+    profile_dir: str | None = None,
+    top: int = 10,
+    memory: bool = False,
+    on_start: Callable[[], None] | None = None,
+) -> T_DayResult:
+    """Parse the input and run a single part (a unit of work for the pool)"""
+    file = input_path(day, input_name)
+    result = {"day": day, "input": file, "status": "ok", "parts": {}}
+
+    cache = ResultCache(cache_path, cache_size) if cache_path is not None else None
+
+    try:
+        _run_parts(day, file, [part_name], cache, result, profile_dir, top, memory, on_start)
+    except Exception as exc:
+        result["status"] = "error"
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        if cache is not None:
+            cache.close()
+
+    return result
+
+
+def _run_part_in_child(conn: Connection, *args) -> None:
+    """
+    Target of the subprocess: signals the start of the part, streams the
+    counters as progress, then sends the result
+    """
+    counters.enable()
+
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def report_progress() -> None:
+        while not done.wait(PROGRESS_INTERVAL):
+            with lock:
+                conn.send(("progress", counters.snapshot()))
+
+    def report_start() -> None:
+        with lock:
+            conn.send(("start", None))
+
+    reporter = threading.Thread(target=report_progress, daemon=True)
+    reporter.start()
+
+    result = run_part(*args, on_start=report_start)
+
+    done.set()
+    reporter.join()
+
+    with lock:
+        conn.send(("result", result))
+
+
+def run_part_isolated(
+    day: str,
+    part_name: str,
+    input_name: str = "input.txt",
+    cache_path: str | None = None,
+    cache_size: int = DEFAULT_MAX_BYTES,
+    profile_dir: str | None = None,
+    top: int = 10,
+    memory: bool = False,
+    timeout: float | None = None,
+) -> T_DayResult:
+    """
+    `run_part` in a subprocess that is killed after `timeout` seconds. The
+    budget covers the part itself: the clock starts when the subprocess
+    signals the start of the part, after its imports and the parsing of the
+    input.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_run_part_in_child,
+        args=(sender, day, part_name, input_name, cache_path, cache_size, profile_dir, top, memory),
+        daemon=True,
+    )
+
+    process.start()
+    sender.close()
+
+    start = None
+    part_counters = {}
+    result = None
+
+    while result is None:
+        elapsed = 0.0 if start is None else time.perf_counter() - start
+        if timeout is not None and elapsed >= timeout:
+            break
+
+        wait = PROGRESS_INTERVAL if timeout is None else min(PROGRESS_INTERVAL, timeout - elapsed)
+        if not receiver.poll(wait):
+            continue
+
+        try:
+            kind, payload = receiver.recv()
+        except EOFError:  # The process died
+            break
+
+        if kind == "start":
+            start = time.perf_counter()
+        elif kind == "progress":
+            part_counters = payload
+        else:
+            result = payload
+
+    elapsed = 0.0 if start is None else time.perf_counter() - start
+
+    if process.is_alive():
+        process.kill()
+    process.join()
+    receiver.close()
+
+    if result is not None:
+        return result
+
+    result = {"day": day, "input": input_path(day, input_name), "parts": {}}
+
+    if process.exitcode == -9 and timeout is not None and elapsed >= timeout:
+        result["status"] = "timeout"
+        result["error"] = f"{part_name} exceeded its budget of {timeout:g}s"
+        result["parts"][part_name] = {
+            "wall": elapsed,
+            "cpu": None,
+            "answer": "",
+            "timeout": timeout,
+            "progress": part_counters,
+        }
+    else:
+        result["status"] = "error"
+        result["error"] = f"{part_name}: worker process exited with code {process.exitcode}"
+
+    return result
+
+
+def parse_budget(spec: str) -> tuple[str, float]:
+    """`day06=30`, `6/part_two=60` or `30` (all parts) -> (key, seconds)"""
+    if "=" not in spec:
+        return DEFAULT_BUDGET, float(spec)
+
+    target, seconds = spec.split("=", 1)
+    day, _, part_name = target.partition("/")
+    key = normalize_day(day) + (f"/{part_name}" if part_name else "")
+
+    return key, float(seconds)
+
+
+def resolve_budget(budgets: T_Budgets, day: str, part_name: str) -> float | None:
+    for key in (f"{day}/{part_name}", day, DEFAULT_BUDGET):
+        if key in budgets:
+            return budgets[key]
+
+    return None
+
+
+def merge_part_results(day: str, part_results: list[T_DayResult]) -> T_DayResult:
+    result = {"day": day, "input": part_results[0]["input"], "status": "ok", "parts": {}}
+
+    parse_timings = [pr["parse"] for pr in part_results if "parse" in pr]
+    if parse_timings:
+        result["parse"] = min(parse_timings, key=lambda t: t["wall"])
+
+    for pr in part_results:
+        result["parts"].update(pr["parts"])
+
+        if pr["status"] == "error":
+            result["status"] = "error"
+            result["error"] = pr["error"]
+        elif pr["status"] == "timeout" and result["status"] == "ok":
+            result["status"] = "timeout"
+            result["error"] = pr["error"]
+
+    return result
+
+
+def load_timings(file: str) -> dict[tuple[str, str], float]:
+    """Expected duration of every (day, part) job from a previous JSON report"""
+    with open(file, "r") as fin:
+        results = json.load(fin)
+
+    timings = {}
+    for result in results:
+        parse = result.get("parse", {}).get("wall", 0.0)
+        for name, part in result["parts"].items():
+            # Cache hits say nothing about the duration of the computation
+            if not part.get("cached", False):
+                timings[(result["day"], name)] = parse + part["wall"]
+
+    return timings
+
+
+def run_parallel(
+    days: list[str],
+    input_name: str,
+    max_workers: int | None,
+    timings: dict[tuple[str, str], float],
+    cache_path: str | None = None,
+    cache_size: int = DEFAULT_MAX_BYTES,
+    profile_dir: str | None = None,
+    top: int = 10,
+    memory: bool = False,
+    budgets: T_Budgets | None = None,
+) -> list[T_DayResult]:
+    """
+    Jobs run in a process pool, or - with `budgets` - each in its own
+    killable process (at most `max_workers` at a time)
+    """
+    results = {}
+    jobs = []
+
+    for day in days:
+        file = input_path(day, input_name)
+        if not os.path.isfile(file):
+            results[day] = {
+                "day": day,
+                "input": file,
+                "status": "skipped",
+                "error": f"Input not found: {file}",
+                "parts": {},
+            }
+            continue
+
+        jobs.extend((day, part_name) for part_name in get_parts(day))
+
+    # Longest jobs first, jobs without history are assumed to be slow
+    jobs.sort(key=lambda job: timings.get(job, math.inf), reverse=True)
+
+    if budgets is None:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        budget_args = {job: () for job in jobs}
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        budget_args = {job: (resolve_budget(budgets, *job),) for job in jobs}
+
+    with executor:
+        futures = {
+            job: executor.submit(
+                run_part if budgets is None else run_part_isolated,
+                *job,
+                input_name,
+                cache_path,
+                cache_size,
+                profile_dir,
+                top,
+                memory,
+                *budget_args[job],
+            )
+            for job in jobs
+        }
+
+    for day in days:
+        if day in results:
+            continue
+
+        results[day] = merge_part_results(day, [
+            futures[(day, part_name)].result()
+            for part_name in get_parts(day)
+        ])
+
+    return [results[day] for day in days]
+
+
+def _format_memory(part: dict[str, Any]) -> str:
+    usage = part.get("memory")
+    if usage is None:
+        return f" {'':>10} {'':>10}"
+
+    rss_peak = f"{usage['rss_peak'] / 2**20:>10.1f}" if usage["rss_peak"] is not None else f"{'-':>10}"
+    return f" {usage['peak'] / 2**20:>10.1f} {rss_peak}"
+
+
+def format_table(results: list[T_DayResult]) -> str:
+    with_memory = any(
+        "memory" in part
+        for result in results
+        for part in result["parts"].values()
+    )
+
+    header = f"{'Day':<6} {'Step':<9} {'Wall [s]':>10} {'CPU [s]':>10}"
+    if with_memory:
+        header += f" {'Peak [MB]':>10} {'RSS [MB]':>10}"
+    header += "  Answer"
+
+    lines = [header, "-" * len(header)]
+
+    total_wall = 0.0
+
+    for result in results:
+        if result["status"] == "skipped":
+            lines.append(f"{result['day']:<6} {'-':<9} {'':>10} {'':>10}  (skipped)")
+            continue
+
+        if "import" in result:
+            imports = result["import"]
+            lines.append(
+                f"{result['day']:<6} {'import':<9} {imports['total']:>10.4f} {'':>10}  "
+                f"{imports.get('error') or format_modules(imports['modules'])}"
+            )
+
+        steps = []
+        if "parse" in result:
+            steps.append(("parse", result["parse"], ""))
+
+        for name, part in result["parts"].items():
+            if "timeout" in part:
+                part_counters = ", ".join(f"{key}={value}" for key, value in part["progress"].items())
+                answer = f"TIMEOUT after {part['timeout']:g}s"
+                if part_counters:
+                    answer += f" ({part_counters})"
+            else:
+                answer = part["answer"] + ("  (cached)" if part.get("cached") else "")
+
+            steps.append((name, part, answer))
+
+        for step, timing, answer in steps:
+            total_wall += timing["wall"]
+            cpu = f"{timing['cpu']:>10.4f}" if timing["cpu"] is not None else f"{'':>10}"
+            memory = _format_memory(timing) if with_memory else ""
+            lines.append(
+                f"{result['day']:<6} {step:<9} "
+                f"{timing['wall']:>10.4f} {cpu}{memory}  {answer}"
+            )
+
+        if result["status"] == "error":
+            lines.append(f"{result['day']:<6} {'error':<9} {'':>10} {'':>10}  {result['error']}")
+
+    lines.append("-" * len(header))
+    lines.append(f"{'Total':<16} {total_wall:>10.4f}")
+
+    return "\n".join(lines)
+
+
+def format_profiles(results: list[T_DayResult]) -> str:
+    """Hot functions of every profiled part"""
+    lines = []
+
+    for result in results:
+        for name, part in result["parts"].items():
+            if "profile" not in part:
+                continue
+
+            profile = part["profile"]
+            lines.append(f"{result['day']} {name} ({profile['pstats']}, {profile['collapsed']})")
+            lines.append(f"{'Own [s]':>10} {'Cum. [s]':>9} {'Calls':>10}  Function")
+            lines.extend(profile["top"])
+            lines.append("")
+
+    return "\n".join(lines)
+
+
+def format_counters(results: list[T_DayResult]) -> str:
+    """Operation counters of every part that reported some"""
+    lines = []
+
+    for result in results:
+        for name, part in result["parts"].items():
+            if part.get("counters"):
+                values = ", ".join(f"{key}={value}" for key, value in part["counters"].items())
+                lines.append(f"{result['day']:<6} {name:<9} {values}")
+
+    return "\n".join(lines)
+
+
+def format_allocations(results: list[T_DayResult]) -> str:
+    """Top allocation sites (close to the peak) of every measured part"""
+    lines = []
+
+    for result in results:
+        for name, part in result["parts"].items():
+            if not part.get("memory", {}).get("top"):
+                continue
+
+            lines.append(f"{result['day']} {name}")
+            lines.append(f"{'Size [MB]':>10} {'Blocks':>10}  Line")
+            lines.extend(part["memory"]["top"])
+            lines.append("")
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run all the daily solutions")
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help="Days to run, e.g. `1 2 day05` (default: all)",
+    )
+    parser.add_argument(
+        "--input",
+        default="input.txt",
+        help="Input file name inside `dayNN/data/` (default: input.txt)",
+    )
+    parser.add_argument(
+        "--json",
+        default=None,
+        help="Write the timings as JSON to the given file (`-` for stdout)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes, 0 means all cores (default: 1)",
+    )
+    parser.add_argument(
+        "--timings",
+        default=None,
+        help="JSON report of a previous run, used to schedule the longest jobs first",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the result and parse caches (always compute, don't store)",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=DEFAULT_PATH,
+        help="Result cache database (default: .cache/results.sqlite)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=DEFAULT_MAX_BYTES / 2**20,
+        help=f"Result cache size limit in MB (default: {DEFAULT_MAX_BYTES // 2**20})",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="Measure the import cost of every day in a fresh interpreter (`-X importtime`)",
+    )
+    measure = parser.add_mutually_exclusive_group()
+    measure.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        default=None,
+        metavar="DIR",
+        help="Profile every part, write `dayNN_part.pstats` and `.collapsed` "
+        "(flamegraph) files to DIR (default: profiles), implies --no-cache",
+    )
+    measure.add_argument(
+        "--memory",
+        action="store_true",
+        help="Record the tracemalloc peak, sampled RSS and top allocation sites "
+        "of every part, implies --no-cache",
+    )
+    parser.add_argument(
+        "--top",
+        "--profile-top",
+        dest="top",
+        type=int,
+        default=10,
+        help="Hot functions / allocation sites shown per part (default: 10)",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="Record operation counters (heap / queue operations, expanded nodes, ...) of every part, "
+        "implies --no-cache",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Time budget of every part in seconds (imports and parsing excluded), "
+        "runs each part in its own process",
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        type=parse_budget,
+        default=[],
+        metavar="DAY[/PART]=SECONDS",
+        help="Time budget of a day's parts or of a single part (repeatable), "
+        "e.g. `--budget 6=10 --budget 18/part_two=30`",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    days = [normalize_day(day) for day in args.days] or list_days()
+
+    # A cache hit would leave nothing to profile / measure / count
+    measuring = args.profile or args.memory or args.counters
+    cache_path = None if args.no_cache or measuring else args.cache_path
+    cache_size = int(args.cache_size * 2**20)
+
+    if args.counters:
+        counters.enable()  # Also in the worker processes (`AOC_COUNTERS`)
+
+    budgets = dict(args.budget)
+    if args.timeout is not None:
+        budgets[DEFAULT_BUDGET] = args.timeout
+
+    start = time.perf_counter()
+
+    if budgets:
+        timings = load_timings(args.timings) if args.timings else {}
+        results = run_parallel(
+            days,
+            args.input,
+            max_workers=args.jobs or os.cpu_count(),
+            timings=timings,
+            cache_path=cache_path,
+            cache_size=cache_size,
+            profile_dir=args.profile,
+            top=args.top,
+            memory=args.memory,
+            budgets=budgets,
+        )
+    elif args.jobs == 1:
+        cache = ResultCache(cache_path, cache_size) if cache_path is not None else None
+        results = [
+            run_day(day, args.input, cache, args.profile, args.top, args.memory)
+            for day in days
+        ]
+
+        if cache is not None:
+            cache.close()
+    else:
+        timings = load_timings(args.timings) if args.timings else {}
+        results = run_parallel(
+            days,
+            args.input,
+            max_workers=args.jobs or os.cpu_count(),
+            timings=timings,
+            cache_path=cache_path,
+            cache_size=cache_size,
+            profile_dir=args.profile,
+            top=args.top,
+            memory=args.memory,
+        )
+
+    elapsed = time.perf_counter() - start
+
+    if args.import_time:
+        costs = import_times([result["day"] for result in results])
+        for result in results:
+            result["import"] = costs[result["day"]]
+
+    if args.json == "-":
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(results))
+        print(f"Elapsed: {elapsed:.4f}s")
+
+        if args.profile:
+            print()
+            print(format_profiles(results))
+
+        if args.memory:
+            print()
+            print(format_allocations(results))
+
+        if args.counters:
+            print()
+            print(format_counters(results))
+
+        if args.json is not None:
+            with open(args.json, "w") as fout:
+                json.dump(results, fout, indent=2)
+
+    num_timeouts = sum(result["status"] == "timeout" for result in results)
+    if num_timeouts and args.json != "-":
+        print(f"{num_timeouts} day(s) exceeded their time budget")
+
+    # Exit codes: 1 - a part failed, 2 - only time budgets were exceeded
+    if any(result["status"] == "error" for result in results):
+        return 1
+
+    return 2 if num_timeouts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""Shortest-path searches over integer node ids
+
+Nodes are `0 .. num_nodes - 1` (e.g. flat grid indices, see `Grid.index`),
+the graph is given as a neighbors function. All searches return flat
+`array("q")` buffers with the distance and predecessor of every node (wrap
+them with `np.frombuffer(dist, dtype=np.int64)` for vectorized passes):
+unreachable nodes have `INF` distance, sources and unreachable nodes have
+`NO_NODE` as predecessor.
+
+All searches accept multiple sources and stop as soon as one of `targets`
+is settled (its distance is final then, other distances may not be).
+
+With `aoc.counters` enabled, the searches count heap pushes / pops
+(`dijkstra`, `astar`), queue pushes / pops (`bfs`, `zero_one_bfs`), bucket
+pushes / pops (`dial`), expanded nodes (`neighbors` calls) and visited
+nodes (finite distance).
+"""
+import heapq
+import sys
+from array import array
+from collections import deque
+from typing import Callable, Iterable
+
+from aoc import counters
+
+
+INF = sys.maxsize
+NO_NODE = -1
+
+T_Neighbors = Callable[[int], Iterable[int]]
+T_WeightedNeighbors = Callable[[int], Iterable[tuple[int, int]]]
+T_SearchResult = tuple[array, array]
+
+# Swapped for counting versions while `aoc.counters` is enabled
+_heappush = heapq.heappush
+_heappop = heapq.heappop
+
+
+def _instrument(enabled: bool) -> None:
+    global _heappush, _heappop
+
+    if enabled:
+        _heappush = counters.counted(heapq.heappush, "search.heap_pushes")
+        _heappop = counters.counted(heapq.heappop, "search.heap_pops")
+    else:
+        _heappush, _heappop = heapq.heappush, heapq.heappop
+
+
+counters.on_toggle(_instrument)
+
+
+def _count_visited(dist: array) -> None:
+    counters.add("search.searches")
+    counters.add("search.visited", len(dist) - dist.count(INF))
+
+
+def _count_queue(kind: str, num_pushes: int, num_left: int) -> None:
+    """Pushes (sources included) and pops, from the entries left unpopped"""
+    counters.add(f"search.{kind}_pushes", num_pushes)
+    counters.add(f"search.{kind}_pops", num_pushes - num_left)
+
+
+def _init_buffers(num_nodes: int, sources: list[int]) -> T_SearchResult:
+    dist = array("q", [INF]) * num_nodes
+    prev = array("q", [NO_NODE]) * num_nodes
+
+    for s in sources:
+        dist[s] = 0
+
+    return dist, prev
+
+
+def bfs(
+    num_nodes: int,
+    sources: Iterable[int],
+    neighbors: T_Neighbors,
+    targets: Iterable[int] = (),
+) -> T_SearchResult:
+    """Unit edge weights, `neighbors(u)` yields the node ids `v`"""
+    sources = list(sources)
+    targets = set(targets)
+    dist, prev = _init_buffers(num_nodes, sources)
+
+    queue = deque(sources)
+    reached_target = False
+
+    while queue:
+        u = queue.popleft()
+
+        if u in targets:
+            reached_target = True
+            break
+
+        alt = dist[u] + 1
+        for v in neighbors(u):
+            if dist[v] == INF:
+                dist[v] = alt
+                prev[v] = u
+                queue.append(v)
+
+    if counters.ENABLED:
+        # Every visited node was queued once, the ones still queued were not expanded
+        num_visited = len(dist) - dist.count(INF)
+        counters.add("search.expanded", num_visited - len(queue) - reached_target)
+        _count_queue("queue", num_visited, len(queue))
+        _count_visited(dist)
+
+    return dist, prev
+
+
+def dijkstra(
+    num_nodes: int,
+    sources: Iterable[int],
+    neighbors: T_WeightedNeighbors,
+    targets: Iterable[int] = (),
+) -> T_SearchResult:
+    """Non-negative edge weights, `neighbors(u)` yields `(v, cost)` pairs"""
+    sources = list(sources)
+    targets = set(targets)
+    dist, prev = _init_buffers(num_nodes, sources)
+
+    if counters.ENABLED:
+        neighbors = counters.counted(neighbors, "search.expanded")
+
+    Q = [(0, s) for s in sources]
+    heapq.heapify(Q)
+
+    while Q:
+        dist_u, u = _heappop(Q)
+
+        if dist_u > dist[u]:
+            continue
+
+        if u in targets:
+            break
+
+        for v, cost in neighbors(u):
+            alt = dist_u + cost
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                _heappush(Q, (alt, v))
+
+    if counters.ENABLED:
+        _count_visited(dist)
+
+    return dist, prev
+
+
+def zero_one_bfs(
+    num_nodes: int,
+    sources: Iterable[int],
+    neighbors: T_WeightedNeighbors,
+    targets: Iterable[int] = (),
+) -> T_SearchResult:
+    """Edge weights 0 or 1, `neighbors(u)` yields `(v, cost)` pairs"""
+    sources = list(sources)
+    targets = set(targets)
+    dist, prev = _init_buffers(num_nodes, sources)
+
+    if counters.ENABLED:
+        neighbors = counters.counted(neighbors, "search.expanded")
+
+    queue = deque((0, s) for s in sources)
+    num_pushes = len(queue)
+
+    while queue:
+        dist_u, u = queue.popleft()
+
+        if dist_u > dist[u]:
+            continue
+
+        if u in targets:
+            break
+
+        for v, cost in neighbors(u):
+            alt = dist_u + cost
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+
+                if cost == 0:
+                    queue.appendleft((alt, v))
+                else:
+                    queue.append((alt, v))
+                num_pushes += 1
+
+    if counters.ENABLED:
+        _count_queue("queue", num_pushes, len(queue))
+        _count_visited(dist)
+
+    return dist, prev
+
+
+def dial(
+    num_nodes: int,
+    sources: Iterable[int],
+    neighbors: T_WeightedNeighbors,
+    max_cost: int,
+    targets: Iterable[int] = (),
+) -> T_SearchResult:
+    """
+    Dijkstra with a (cyclic) bucket queue, for small integer edge weights in
+    `0 .. max_cost` - no heap operations, O(E + max distance)
+    """
+    sources = list(sources)
+    targets = set(targets)
+    dist, prev = _init_buffers(num_nodes, sources)
+
+    if counters.ENABLED:
+        neighbors = counters.counted(neighbors, "search.expanded")
+
+    num_buckets = max_cost + 1
+    buckets: list[list[int]] = [[] for _ in range(num_buckets)]
+    buckets[0].extend(sources)
+    num_pending = num_pushes = len(sources)
+
+    dist_u = 0
+    while num_pending > 0:
+        bucket = buckets[dist_u % num_buckets]
+
+        while bucket:
+            u = bucket.pop()
+            num_pending -= 1
+
+            if dist[u] != dist_u:  # Outdated entry
+                continue
+
+            if u in targets:
+                if counters.ENABLED:
+                    _count_queue("bucket", num_pushes, num_pending)
+                    _count_visited(dist)
+                return dist, prev
+
+            for v, cost in neighbors(u):
+                alt = dist_u + cost
+                if alt < dist[v]:
+                    dist[v] = alt
+                    prev[v] = u
+                    buckets[alt % num_buckets].append(v)
+                    num_pending += 1
+                    num_pushes += 1
+
+        dist_u += 1
+
+    if counters.ENABLED:
+        _count_queue("bucket", num_pushes, num_pending)
+        _count_visited(dist)
+
+    return dist, prev
+
+
+def astar(
+    num_nodes: int,
+    sources: Iterable[int],
+    neighbors: T_WeightedNeighbors,
+    heuristic: Callable[[int], int],
+    targets: Iterable[int],
+) -> T_SearchResult:
+    """Dijkstra guided by an admissible and consistent `heuristic(u)`"""
+    sources = list(sources)
+    targets = set(targets)
+    dist, prev = _init_buffers(num_nodes, sources)
+
+    if counters.ENABLED:
+        neighbors = counters.counted(neighbors, "search.expanded")
+
+    Q = [(heuristic(s), 0, s) for s in sources]
+    heapq.heapify(Q)
+
+    while Q:
+        _, dist_u, u = _heappop(Q)
+
+        if dist_u > dist[u]:
+            continue
+
+        if u in targets:
+            break
+
+        for v, cost in neighbors(u):
+            alt = dist_u + cost
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                _heappush(Q, (alt + heuristic(v), alt, v))
+
+    if counters.ENABLED:
+        _count_visited(dist)
+
+    return dist, prev
+
+
+def reconstruct_path(prev: array, target: int) -> list[int]:
+    """Nodes from the source to `target` (the target has to be reachable)"""
+    path = [target]
+
+    while prev[path[-1]] != NO_NODE:
+        path.append(prev[path[-1]])
+
+    return path[::-1]
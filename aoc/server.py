@@ -0,0 +1,213 @@
+"""Long-lived local solver service
+
+A threaded HTTP server on localhost dispatches requests to a pool of worker
+processes. Every worker imports all the days (and their heavy dependencies)
+once at startup and keeps the modules, so memo tables like day19's
+`lru_cache` stay warm between requests.
+
+    POST /solve/<day>/<part>   body: raw input  ->  {"answer", "wall", "cpu"}
+    GET  /stats                request count, errors and latencies per (day, part)
+    GET  /days                 the days and parts that can be solved
+
+Usage: python -m aoc.server [--host HOST] [--port PORT] [--jobs N]
+"""
+import argparse
+import importlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+from typing import Any
+
+from aoc.days import get_parts, list_days, load_day, normalize_day
+from aoc.runner import timed
+
+
+DEFAULT_PORT = 8024
+
+# Imported lazily by the days, preloaded by the workers
+WARM_IMPORTS = ("numpy", "networkx")
+
+# Latencies kept per (day, part) for the stats
+LATENCY_WINDOW = 1000
+
+# Per worker process
+_MODULES: dict[str, ModuleType] = {}
+
+
+def _init_worker() -> None:
+    for name in WARM_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    for day in list_days():
+        try:
+            _MODULES[day] = load_day(day)
+        except Exception:  # Reported when the day is requested
+            pass
+
+
+def solve(day: str, part_name: str, raw: bytes) -> dict[str, Any]:
+    """Solve one input in a worker (the days read their input from a file)"""
+    if day not in _MODULES:
+        _MODULES[day] = load_day(day)
+
+    module = _MODULES[day]
+    part = get_parts(day)[part_name]
+
+    with tempfile.NamedTemporaryFile(suffix=".txt") as fin:
+        fin.write(raw)
+        fin.flush()
+
+        data = module.read_input(fin.name)
+        answer, timing = timed(part, module, data)
+
+    return {"answer": str(answer), **timing}
+
+
+class Stats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=LATENCY_WINDOW),
+        )
+        self._num_requests: dict[str, int] = defaultdict(int)
+        self._num_errors: dict[str, int] = defaultdict(int)
+        self._start = time.time()
+
+    def record(self, key: str, latency: float, error: bool) -> None:
+        with self._lock:
+            self._latencies[key].append(latency)
+            self._num_requests[key] += 1
+            self._num_errors[key] += error
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            parts = {}
+            for key, latencies in self._latencies.items():
+                ordered = sorted(latencies)
+                parts[key] = {
+                    "requests": self._num_requests[key],
+                    "errors": self._num_errors[key],
+                    "mean": statistics.fmean(ordered),
+                    "p50": ordered[len(ordered) // 2],
+                    "p95": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+                    "max": ordered[-1],
+                }
+
+        return {
+            "uptime": time.time() - self._start,
+            "requests": sum(part["requests"] for part in parts.values()),
+            "parts": parts,
+        }
+
+
+class SolverServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], executor: ProcessPoolExecutor):
+        super().__init__(address, SolverHandler)
+        self.executor = executor
+        self.stats = Stats()
+        self.days = set(list_days())
+
+
+class SolverHandler(BaseHTTPRequestHandler):
+    server: SolverServer
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.server.stats.summary())
+        elif self.path == "/days":
+            self._send_json(200, {day: list(get_parts(day)) for day in list_days()})
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        start = time.perf_counter()
+
+        try:
+            _, endpoint, day, part_name = self.path.split("/")
+            day = normalize_day(day)
+            if endpoint != "solve" or day not in self.server.days or part_name not in get_parts(day):
+                raise ValueError
+        except ValueError:
+            self._send_json(404, {"error": f"Expected /solve/<day>/<part>, got {self.path}"})
+            return
+
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        try:
+            result = self.server.executor.submit(solve, day, part_name, raw).result()
+            status = 200
+        except Exception as exc:
+            result = {"error": f"{type(exc).__name__}: {exc}"}
+            status = 500
+
+        self._send_json(status, result)
+        self.server.stats.record(
+            f"{day}/{part_name}",
+            time.perf_counter() - start,
+            error=status != 200,
+        )
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Latencies are in /stats, keep the console quiet
+
+
+def serve(host: str, port: int, max_workers: int) -> None:
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        # Start (and warm up) all the workers before accepting requests
+        for future in [executor.submit(os.getpid) for _ in range(max_workers)]:
+            future.result()
+
+        with SolverServer((host, port), executor) as server:
+            print(f"Serving on http://{host}:{port}", file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the daily solutions over local HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Port (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes, 0 means all cores (default: 0)",
+    )
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, max_workers=args.jobs or os.cpu_count())
+
+
+if __name__ == "__main__":
+    main()
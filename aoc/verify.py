@@ -0,0 +1,109 @@
+"""Differential verification of the registered implementations
+
+Every fast variant of a part (see `aoc.days.get_variants`) is run on
+randomized generated inputs and compared with the reference implementation;
+a mismatch is reported with the generator seed that reproduces it
+(`python -m aoc.generators DAY --scale S --seed N`).
+
+Usage: python -m aoc.verify [DAY ...] [--trials N] [--scale S] [--seed N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+from typing import Any
+
+from aoc.days import REFERENCE, get_variants, list_days, load_day, normalize_day
+from aoc.generators import part_kwargs, write_input
+from aoc.runner import timed
+
+
+T_Mismatch = dict[str, Any]
+
+
+def verify_input(day: str, file: str, kwargs: dict[str, Any]) -> list[T_Mismatch]:
+    module = load_day(day)
+    mismatches = []
+
+    for part_name, variants in get_variants(day).items():
+        answers = {}
+
+        for name, part in variants.items():
+            # Re-parse, so that a variant can't see data mutated by another one
+            data = module.read_input(file)
+            try:
+                answers[name], _ = timed(part, module, data, **kwargs)
+            except Exception as exc:
+                answers[name] = f"{type(exc).__name__}: {exc}"
+
+        expected = answers.pop(REFERENCE)
+        mismatches.extend(
+            {"part": part_name, "variant": name, "expected": expected, "actual": actual}
+            for name, actual in answers.items()
+            if actual != expected
+        )
+
+    return mismatches
+
+
+def verify_day(
+    day: str,
+    trials: int,
+    scale: float,
+    seed: int = 0,
+) -> list[T_Mismatch]:
+    mismatches = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for trial_seed in range(seed, seed + trials):
+            file = write_input(day, tmp_dir, scale=scale, seed=trial_seed)
+
+            for mismatch in verify_input(day, file, part_kwargs(day, scale)):
+                mismatches.append({"day": day, "scale": scale, "seed": trial_seed, **mismatch})
+
+            os.remove(file)
+
+    return mismatches
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Cross-check fast implementations against the reference")
+    parser.add_argument("days", nargs="*", help="Days to verify (default: all with variants)")
+    parser.add_argument("--trials", type=int, default=10, help="Inputs per day (default: 10)")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=0.5,
+        help="Scale of the generated inputs, keep it small for slow references (default: 0.5)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="First generator seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    days = [normalize_day(day) for day in args.days] or list_days()
+    days = [day for day in days if get_variants(day)]
+
+    num_mismatches = 0
+
+    for day in days:
+        mismatches = verify_day(day, args.trials, args.scale, args.seed)
+        num_mismatches += len(mismatches)
+
+        variants = ", ".join(
+            f"{part_name}: {', '.join(name for name in variants if name != REFERENCE)}"
+            for part_name, variants in get_variants(day).items()
+        )
+        status = "ok" if not mismatches else f"{len(mismatches)} mismatch(es)"
+        print(f"{day} ({variants}) - {args.trials} inputs: {status}")
+
+        for mismatch in mismatches:
+            print(
+                f"  {mismatch['part']}/{mismatch['variant']} "
+                f"scale={mismatch['scale']:g} seed={mismatch['seed']}: "
+                f"expected {mismatch['expected']!r}, got {mismatch['actual']!r}"
+            )
+
+    return int(num_mismatches > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Multi-word search in all 8 directions of a letter grid
+
+All the words (and their reversals, for the opposite directions) go into
+one Aho-Corasick automaton with a dense transition table. The automaton
+runs over the rows, columns, diagonals and anti-diagonals of the grid, all
+the lines of a family in lockstep (one vectorized table lookup per step),
+so a query costs one pass per line regardless of the number of words.
+"""
+from collections import deque
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from aoc.grid import Grid
+
+
+# (word, x, y, dx, dy): the word reads from (x, y) in direction (dx, dy)
+T_Occurrence = tuple[str, int, int, int, int]
+
+# Characters of line `l` at step `r`, cells of (step, lines), direction
+T_Family = tuple[
+    Iterator[np.ndarray],
+    Callable[[int, np.ndarray], tuple[np.ndarray, np.ndarray]],
+    tuple[int, int],
+]
+
+
+class AhoCorasick:
+    """
+    Automaton over byte patterns. Characters outside the patterns share the
+    alphabet index 0, which always leads back to the root.
+    """
+
+    def __init__(self, patterns: list[bytes]):
+        if not patterns or not all(patterns):
+            raise ValueError("AhoCorasick: patterns must be non-empty")
+
+        self.patterns = patterns
+
+        alphabet = sorted(set(b"".join(patterns)))
+        self.char_map = np.zeros(256, dtype=np.uint8 if len(alphabet) < 256 else np.int32)
+        self.char_map[alphabet] = np.arange(1, len(alphabet) + 1)
+
+        # Trie
+        children: list[dict[int, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+
+        for idx, pattern in enumerate(patterns):
+            state = 0
+            for char in self.char_map[list(pattern)].tolist():
+                if char not in children[state]:
+                    children[state][char] = len(children)
+                    children.append({})
+                    outputs.append([])
+                state = children[state][char]
+            outputs[state].append(idx)
+
+        # Dense transitions (failure links resolved), in BFS order so that
+        # the failure target of a state is complete before the state itself
+        self.delta = np.zeros((len(children), len(alphabet) + 1), dtype=np.int32)
+        fail = [0] * len(children)
+        queue = deque(children[0].values())
+
+        for char, child in children[0].items():
+            self.delta[0, char] = child
+
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+
+            self.delta[state] = self.delta[fail[state]]
+            for char, child in children[state].items():
+                fail[child] = int(self.delta[fail[state], char])
+                self.delta[state, char] = child
+                queue.append(child)
+
+        self.outputs = [tuple(output) for output in outputs]
+        self.has_output = np.array([bool(output) for output in outputs])
+
+    def __len__(self) -> int:
+        return len(self.delta)
+
+    def scan(self, steps: Iterable[np.ndarray]) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Runs the automaton over many lines in lockstep (`steps[r][l]` is the
+        `r`-th byte of line `l`) and yields `(r, lines, states)` wherever
+        patterns end
+        """
+        states = None
+
+        for step, chars in enumerate(steps):
+            if states is None:
+                states = np.zeros(len(chars), dtype=np.int32)
+
+            states = self.delta[states, self.char_map[chars]]
+
+            lines = np.flatnonzero(self.has_output[states])
+            if len(lines):
+                yield step, lines, states[lines]
+
+
+def _line_families(cells: np.ndarray) -> Iterator[T_Family]:
+    """Rows, columns, diagonals and anti-diagonals, read forwards"""
+    height, width = cells.shape
+
+    yield (
+        (cells[:, x] for x in range(width)),
+        lambda x, ys: (np.full_like(ys, x), ys),
+        (1, 0),
+    )
+    yield (
+        (cells[y] for y in range(height)),
+        lambda y, xs: (xs, np.full_like(xs, y)),
+        (0, 1),
+    )
+
+    # Diagonals are padded with NUL bytes (never part of a word) to lines of
+    # equal length: line `l` holds the cells with x = l - offset(y)
+    def padded(offset: Callable[[int], int]) -> Iterator[np.ndarray]:
+        for y in range(height):
+            line = np.zeros(width + height - 1, dtype=np.uint8)
+            line[offset(y):offset(y) + width] = cells[y]
+            yield line
+
+    for offset, direction in ((lambda y: height - 1 - y, (1, 1)), (lambda y: y, (-1, 1))):
+        yield (
+            padded(offset),
+            lambda y, lines, offset=offset: (lines - offset(y), np.full_like(lines, y)),
+            direction,
+        )
+
+
+def _build(words: Iterable[str]) -> tuple[AhoCorasick, list[str]]:
+    """Automaton over the words (pattern `i`) and their reversals (pattern `n + i`)"""
+    words = list(dict.fromkeys(words))
+    patterns = [word.encode() for word in words]
+    return AhoCorasick(patterns + [pattern[::-1] for pattern in patterns]), words
+
+
+def _as_cells(grid: Grid | np.ndarray) -> np.ndarray:
+    return grid.cells if isinstance(grid, Grid) else np.asarray(grid, dtype=np.uint8)
+
+
+def find_words(grid: Grid | np.ndarray, words: Iterable[str]) -> list[T_Occurrence]:
+    """All occurrences of the words, in any of the 8 directions"""
+    words = list(words)
+    if not words:
+        return []
+
+    automaton, words = _build(words)
+    cells = _as_cells(grid)
+    occurrences = []
+
+    for steps, to_cells, (dx, dy) in _line_families(cells):
+        for step, lines, states in automaton.scan(steps):
+            xs, ys = to_cells(step, lines)
+
+            for x, y, state in zip(xs.tolist(), ys.tolist(), states.tolist()):
+                for idx in automaton.outputs[state]:
+                    # (x, y) is the last cell of the pattern along the line
+                    length = len(automaton.patterns[idx])
+                    if idx < len(words):
+                        start = (x - (length - 1) * dx, y - (length - 1) * dy)
+                        occurrences.append((words[idx], *start, dx, dy))
+                    else:
+                        occurrences.append((words[idx - len(words)], x, y, -dx, -dy))
+
+    return occurrences
+
+
+def count_words(grid: Grid | np.ndarray, words: Iterable[str]) -> dict[str, int]:
+    """Number of occurrences of every word, in any of the 8 directions"""
+    words = list(words)
+    if not words:
+        return {}
+
+    automaton, words = _build(words)
+    cells = _as_cells(grid)
+
+    hits = np.zeros(len(automaton), dtype=np.int64)
+    for steps, _, _ in _line_families(cells):
+        for _, _, states in automaton.scan(steps):
+            np.add.at(hits, states, 1)
+
+    counts = dict.fromkeys(words, 0)
+    for state in np.flatnonzero(hits).tolist():
+        for idx in automaton.outputs[state]:
+            counts[words[idx % len(words)]] += int(hits[state])
+
+    return counts
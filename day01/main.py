@@ -1,20 +1,49 @@
-"""Day 01"""
-from collections import Counter
+"""Day 01
+
+Besides the in-memory solution, both answers can be computed out of core
+for inputs that do not fit into memory (`python main.py --stream FILE`):
+the input is parsed in chunks, every `run_size` pairs are sorted and spilled
+to disk as `.npy` runs, and the runs are k-way merged back (memory-mapped,
+block by block). Distances are summed over the two merged streams and the
+similarity is joined from their streamed (value, count) tables.
+"""
+import argparse
+import bisect
+import math
+import os
+import random
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from typing import Iterable, Iterator
+
+import numpy as np
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.loader import iter_ints, map_file, read_ints  # noqa: E402
 
 
 T_Data = tuple[list[int], list[int]]
+T_Counts = tuple[np.ndarray, np.ndarray]
 
+# Pairs per sorted run (2 x 32 MB of int64)
+RUN_SIZE = 1 << 22
 
-def read_input(file: str) -> T_Data:
-    left, right = [], []
+# Elements held in memory over all the runs during a merge
+MERGE_BUFFER_SIZE = 1 << 22
+
+# Smallest number of value intervals per block of `LocationLists`
+MIN_BLOCK_SIZE = 256
+
+_EMPTY = np.empty(0, dtype=np.int64)
 
-    with open(file, "r") as fin:
-        for line in fin:
-            parts = line.strip().split(" ")
-            left.append(int(parts[0]))
-            right.append(int(parts[-1]))
 
-    return left, right
+def read_input(file: str) -> T_Data:
+    numbers = read_ints(file)
+    return numbers[0::2].tolist(), numbers[1::2].tolist()
 
 
 def compute_sum_of_distances(data: T_Data) -> int:
@@ -36,13 +65,488 @@ def compute_similarity_score(data: T_Data) -> int:
     ])
 
 
+def spill_sorted_runs(
+    file: str,
+    directory: str,
+    run_size: int = RUN_SIZE,
+) -> tuple[list[str], list[str]]:
+    """Sorted runs of the left and right column, saved as `.npy` files"""
+    left_runs, right_runs = [], []
+    chunks, num_pending = [], 0
+
+    def spill(numbers: np.ndarray) -> None:
+        columns = (
+            (numbers[0::2], left_runs, "left"),
+            (numbers[1::2], right_runs, "right"),
+        )
+        for column, runs, name in columns:
+            path = os.path.join(directory, f"{name}_{len(runs):06d}.npy")
+            np.save(path, np.sort(column))
+            runs.append(path)
+
+    for chunk in iter_ints(map_file(file)):
+        chunks.append(chunk)
+        num_pending += len(chunk)
+
+        if num_pending >= 2 * run_size:
+            pending = np.concatenate(chunks)
+            spill(pending[:2 * run_size])
+            chunks, num_pending = [pending[2 * run_size:]], len(pending) - 2 * run_size
+
+    pending = np.concatenate(chunks) if chunks else _EMPTY
+    if len(pending) % 2:
+        raise ValueError("Odd number of location IDs")
+    if len(pending):
+        spill(pending)
+
+    return left_runs, right_runs
+
+
+def merge_runs(
+    paths: list[str],
+    buffer_size: int = MERGE_BUFFER_SIZE,
+) -> Iterator[np.ndarray]:
+    """Sorted blocks of the k-way merge of the sorted runs"""
+    runs = [np.load(path, mmap_mode="r") for path in paths]
+    block_size = max(1024, buffer_size // max(1, len(runs)))
+    positions = [0] * len(runs)
+    active = [idx for idx, run in enumerate(runs) if len(run)]
+
+    while active:
+        blocks = {
+            idx: runs[idx][positions[idx]:positions[idx] + block_size]
+            for idx in active
+        }
+
+        # Values past a block are >= its last value, so everything up to the
+        # smallest last value is final (and that block is taken completely)
+        bound = min(block[-1] for block in blocks.values())
+
+        parts = []
+        for idx, block in blocks.items():
+            end = int(np.searchsorted(block, bound, side="right"))
+            parts.append(block[:end])
+            positions[idx] += end
+
+        active = [idx for idx in active if positions[idx] < len(runs[idx])]
+
+        yield np.sort(np.concatenate(parts))
+
+
+def _next_nonempty(blocks: Iterator) -> tuple | None:
+    """Next block (tuple of aligned arrays) with at least one element"""
+    for block in blocks:
+        if len(block[0]):
+            return block
+    return None
+
+
+def _value_counts(blocks: Iterator[np.ndarray]) -> Iterator[T_Counts]:
+    """Streamed count table: (values, counts) of sorted blocks"""
+    carry = None
+
+    for block in blocks:
+        starts = np.flatnonzero(np.concatenate(([True], block[1:] != block[:-1])))
+        values = block[starts]
+        counts = np.diff(np.append(starts, len(block)))
+
+        if carry is not None:
+            if values[0] == carry[0]:
+                counts[0] += carry[1]
+            else:
+                values = np.concatenate((carry[:1], values))
+                counts = np.concatenate((carry[1:], counts))
+
+        # The last value may continue in the next block
+        yield values[:-1], counts[:-1]
+        carry = np.array([values[-1], counts[-1]])
+
+    if carry is not None:
+        yield carry[:1], carry[1:]
+
+
+def sum_of_distances(left_blocks: Iterator[np.ndarray], right_blocks: Iterator[np.ndarray]) -> int:
+    result = 0
+    left, right = _EMPTY, _EMPTY
+
+    while True:
+        if not len(left):
+            left = next(left_blocks, None)
+        if not len(right):
+            right = next(right_blocks, None)
+
+        if left is None or right is None:
+            if left is not right:
+                raise ValueError("Columns of different lengths")
+            return result
+
+        n = min(len(left), len(right))
+        result += int(np.abs(left[:n] - right[:n]).sum())
+        left, right = left[n:], right[n:]
+
+
+def similarity_score(left_counts: Iterator[T_Counts], right_counts: Iterator[T_Counts]) -> int:
+    """Merge join of the two streamed count tables"""
+    result = 0
+    left, right = (_EMPTY, _EMPTY), (_EMPTY, _EMPTY)
+
+    while True:
+        if not len(left[0]):
+            left = _next_nonempty(left_counts)
+        if not len(right[0]):
+            right = _next_nonempty(right_counts)
+
+        if left is None or right is None:
+            return result
+
+        # Values up to the smaller last value are complete on both sides
+        bound = min(left[0][-1], right[0][-1])
+        left_end = int(np.searchsorted(left[0], bound, side="right"))
+        right_end = int(np.searchsorted(right[0], bound, side="right"))
+
+        values, left_idxs, right_idxs = np.intersect1d(
+            left[0][:left_end],
+            right[0][:right_end],
+            assume_unique=True,
+            return_indices=True,
+        )
+        result += int((values * left[1][left_idxs] * right[1][right_idxs]).sum())
+
+        left = left[0][left_end:], left[1][left_end:]
+        right = right[0][right_end:], right[1][right_end:]
+
+
+def solve_streaming(
+    file: str,
+    run_size: int = RUN_SIZE,
+    tmp_dir: str | None = None,
+) -> tuple[int, int]:
+    """Both answers in memory bounded by `run_size` and `MERGE_BUFFER_SIZE`"""
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        left_runs, right_runs = spill_sorted_runs(file, directory, run_size)
+
+        distances = sum_of_distances(merge_runs(left_runs), merge_runs(right_runs))
+        similarity = similarity_score(
+            _value_counts(merge_runs(left_runs)),
+            _value_counts(merge_runs(right_runs)),
+        )
+
+    return distances, similarity
+
+
+class _Block:
+    """
+    Consecutive intervals `[key, next key)` of the value axis, with their
+    widths and differences `C` (stored without the block's lazy offset)
+    """
+
+    def __init__(self, keys: list[int], widths: np.ndarray, cs: np.ndarray):
+        self.keys = keys
+        self.widths = np.array(widths, dtype=np.int64)
+        self.cs = np.array(cs, dtype=np.int64)
+        self.lazy = 0
+
+        self.total_width = int(self.widths.sum())
+        self.negative_width = int(self.widths[self.cs < 0].sum())  # Width of the intervals with C < 0
+        self.width_by_c: defaultdict[int, int] = defaultdict(int)
+
+        values, widths_by_value = _group_widths(self.cs, self.widths)
+        self.width_by_c.update(zip(values, widths_by_value))
+
+    def _add_entry(self, c: int, width: int) -> None:
+        self.total_width += width
+        self.width_by_c[c] += width
+        if c + self.lazy < 0:
+            self.negative_width += width
+
+    def effective_cs(self) -> np.ndarray:
+        return self.cs + self.lazy
+
+    def insert(self, idx: int, key: int, width: int, c: int) -> int:
+        """Returns the change of the distance"""
+        self.keys.insert(idx, key)
+        self.widths = np.concatenate((self.widths[:idx], [width], self.widths[idx:]))
+        self.cs = np.concatenate((self.cs[:idx], [c - self.lazy], self.cs[idx:]))
+        self._add_entry(c - self.lazy, width)
+        return abs(c) * width
+
+    def set_width(self, idx: int, width: int) -> int:
+        """Returns the change of the distance"""
+        c, change = int(self.cs[idx]), width - int(self.widths[idx])
+        self.widths[idx] = width
+        self._add_entry(c, change)
+        return abs(c + self.lazy) * change
+
+    def add_range(self, start: int, end: int, delta: int) -> int:
+        """Adds `delta` to C of the entries `start:end`, returns the change of the distance"""
+        width_by_c, lazy = self.width_by_c, self.lazy
+        change, negative_change = 0, 0
+
+        # C is close to a +-1 walk, so a range has few distinct values
+        for c, width in zip(*_group_widths(self.cs[start:end], self.widths[start:end])):
+            width_by_c[c] -= width
+            width_by_c[c + delta] += width
+
+            old, new = c + lazy, c + lazy + delta
+            change += (abs(new) - abs(old)) * width
+            negative_change += ((new < 0) - (old < 0)) * width
+
+        self.cs[start:end] += delta
+        self.negative_width += negative_change
+        return change
+
+    def shift(self, delta: int) -> int:
+        """Adds `delta` (+-1) to every C in O(1), returns the change of the distance"""
+        if delta == 1:
+            change = self.total_width - 2 * self.negative_width
+            self.negative_width -= self.width_by_c.get(-self.lazy - 1, 0)
+        else:
+            zero_width = self.width_by_c.get(-self.lazy, 0)
+            change = 2 * (self.negative_width + zero_width) - self.total_width
+            self.negative_width += zero_width
+
+        self.lazy += delta
+        return change
+
+
+def _group_widths(cs: np.ndarray, widths: np.ndarray) -> tuple[list[int], list[int]]:
+    """Distinct values of `cs` and the total width of each"""
+    if not len(cs):
+        return [], []
+
+    order = np.argsort(cs)
+    cs = cs[order]
+    starts = np.flatnonzero(np.concatenate(([True], cs[1:] != cs[:-1])))
+
+    return cs[starts].tolist(), np.add.reduceat(widths[order], starts).tolist()
+
+
+class LocationLists:
+    """
+    Both lists under insertion / removal of pairs, with the sum of distances
+    and the similarity score kept up to date.
+
+    For lists of equal length, the sum of distances of the sorted lists is the
+    integral of |C(t)| over the value axis, C(t) = #left <= t - #right <= t.
+    Adding the pair (l, r) adds +-1 to C on [min(l, r), max(l, r)), so the
+    intervals between the IDs seen so far are kept in sorted blocks of about
+    2 sqrt(number of IDs) intervals, with a lazy offset and a width-by-C
+    table each. An update touches the intervals of at most two boundary
+    blocks (vectorized, grouped by C) and shifts the blocks in between in
+    O(1) each - O(sqrt(n)) instead of a re-sort. Whenever the ideal block
+    size has doubled, the blocks are rebuilt from the count maps (amortized
+    O(log n) per update), which also drops the IDs removed since; large
+    batches of `extend` are rebuilt the same way. The similarity score
+    follows from the count maps in O(1).
+    """
+
+    def __init__(self, pairs: Iterable[tuple[int, int]] = (), min_block_size: int = MIN_BLOCK_SIZE):
+        self.left_counts: Counter[int] = Counter()
+        self.right_counts: Counter[int] = Counter()
+        self.sum_of_distances = 0
+        self.similarity_score = 0
+
+        self._min_block_size = min_block_size
+        self._block_size = min_block_size
+        self._blocks: list[_Block] = []
+        self._firsts: list[int] = []  # First key per block
+        self._keys: set[int] = set()
+
+        self.extend(pairs)
+
+    def __len__(self) -> int:
+        return self.left_counts.total()
+
+    def add(self, left: int, right: int) -> None:
+        self._insert_key(left)
+        self._insert_key(right)
+        self._add_to_range(left, right, 1)
+
+        self.similarity_score += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.similarity_score += right * self.left_counts[right]
+        self.right_counts[right] += 1
+
+        if self._ideal_block_size() > 2 * self._block_size:
+            self._rebuild()
+
+    def remove(self, left: int, right: int) -> None:
+        if not self.left_counts[left] or not self.right_counts[right]:
+            raise ValueError(f"Pair ({left}, {right}) is not in the lists")
+
+        self._add_to_range(left, right, -1)
+
+        self.right_counts[right] -= 1
+        self.similarity_score -= right * self.left_counts[right]
+        self.left_counts[left] -= 1
+        self.similarity_score -= left * self.right_counts[left]
+
+        for counts, key in ((self.left_counts, left), (self.right_counts, right)):
+            if not counts[key]:
+                del counts[key]
+
+    def extend(self, pairs: Iterable[tuple[int, int]]) -> None:
+        pairs = list(pairs)
+
+        # One by one, a pair costs about a block size - a rebuild about an ID
+        if len(pairs) * self._block_size < len(self._keys):
+            for left, right in pairs:
+                self.add(left, right)
+            return
+
+        for left, right in pairs:
+            self.left_counts[left] += 1
+            self.right_counts[right] += 1
+
+        self.similarity_score = sum(
+            value * count * self.right_counts[value]
+            for value, count in self.left_counts.items()
+        )
+        self._rebuild()
+
+    def _ideal_block_size(self) -> int:
+        return max(self._min_block_size, 2 * math.isqrt(len(self._keys)))
+
+    def _rebuild(self) -> None:
+        """Blocks from scratch, of the ideal size for the current IDs"""
+        keys = sorted(self.left_counts.keys() | self.right_counts.keys())
+        self._keys = set(keys)
+        self._block_size = size = self._ideal_block_size()
+
+        steps = np.fromiter(
+            (self.left_counts[key] - self.right_counts[key] for key in keys),
+            dtype=np.int64,
+            count=len(keys),
+        )
+        cs = np.cumsum(steps)
+        widths = np.diff(np.array(keys, dtype=np.int64), append=keys[-1:])  # Last interval empty
+
+        self.sum_of_distances = int((np.abs(cs) * widths).sum())
+
+        self._blocks = [
+            _Block(keys[start:start + size], widths[start:start + size], cs[start:start + size])
+            for start in range(0, len(keys), size)
+        ]
+        self._firsts = keys[::size]
+
+    def _locate(self, key: int) -> tuple[int, int]:
+        """Block and entry index of a known key"""
+        block_idx = bisect.bisect_right(self._firsts, key) - 1
+        return block_idx, bisect.bisect_left(self._blocks[block_idx].keys, key)
+
+    def _insert_key(self, key: int) -> None:
+        """Splits the interval containing `key` (C stays the same on both halves)"""
+        if key in self._keys:
+            return
+        self._keys.add(key)
+
+        if not self._blocks:
+            self._blocks.append(_Block([key], [0], [0]))
+            self._firsts.append(key)
+            return
+
+        # Below all IDs (C = 0)
+        if key < self._firsts[0]:
+            block_idx, block = 0, self._blocks[0]
+            block.insert(0, key, block.keys[0] - key, 0)
+            self._firsts[0] = key
+        else:
+            block_idx, idx = self._locate(key)
+            block = self._blocks[block_idx]
+
+            if idx < len(block.keys):
+                next_key = block.keys[idx]
+            elif block_idx + 1 < len(self._blocks):
+                next_key = self._firsts[block_idx + 1]
+            else:  # Above all IDs, where C = 0 (and the last interval is empty)
+                next_key = key
+
+            # Net zero: the width moves from the split interval to the new one
+            self.sum_of_distances += block.set_width(idx - 1, key - block.keys[idx - 1])
+            c = int(block.cs[idx - 1]) + block.lazy
+            self.sum_of_distances += block.insert(idx, key, next_key - key, c)
+
+        if len(block.keys) > 2 * self._block_size:
+            self._split(block_idx)
+
+    def _split(self, block_idx: int) -> None:
+        block = self._blocks[block_idx]
+        cs, half = block.effective_cs(), len(block.keys) // 2
+
+        self._blocks[block_idx:block_idx + 1] = [
+            _Block(block.keys[:half], block.widths[:half], cs[:half]),
+            _Block(block.keys[half:], block.widths[half:], cs[half:]),
+        ]
+        self._firsts.insert(block_idx + 1, block.keys[half])
+
+    def _add_to_range(self, left: int, right: int, sign: int) -> None:
+        """Adds (`sign` times) one left and one right ID to C"""
+        if left == right:
+            return
+
+        # C += 1 from `left` on, C -= 1 from `right` on
+        start, end, delta = (left, right, sign) if left < right else (right, left, -sign)
+
+        start_block, start_idx = self._locate(start)
+        end_block, end_idx = self._locate(end)
+
+        if start_block == end_block:
+            change = self._blocks[start_block].add_range(start_idx, end_idx, delta)
+        else:
+            block = self._blocks[start_block]
+            change = block.add_range(start_idx, len(block.keys), delta)
+            for block in self._blocks[start_block + 1:end_block]:
+                change += block.shift(delta)
+            change += self._blocks[end_block].add_range(0, end_idx, delta)
+
+        self.sum_of_distances += change
+
+
 def run_tests() -> None:
     data = read_input("data/example.txt")
     assert compute_sum_of_distances(data) == 11
     assert compute_similarity_score(data) == 31
 
+    assert solve_streaming("data/example.txt", run_size=2) == (11, 31)
+
+    lists = LocationLists(zip(*data))
+    assert (lists.sum_of_distances, lists.similarity_score) == (11, 31)
+    lists.remove(3, 3)
+    lists.add(3, 3)
+    assert (lists.sum_of_distances, lists.similarity_score) == (11, 31)
+
+    # Tiny blocks (splits, shifts, rebuilds and a batch) against a re-sort
+    rng = random.Random(0)
+    lists, pairs = LocationLists(min_block_size=2), []
+    for step in range(300):
+        if step == 150:
+            batch = [(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(100)]
+            lists.extend(batch)
+            pairs += batch
+        elif pairs and rng.random() < 0.2:
+            lists.remove(*pairs.pop(rng.randrange(len(pairs))))
+        else:
+            pairs.append((rng.randint(0, 50), rng.randint(0, 50)))
+            lists.add(*pairs[-1])
+
+        data = [left for left, _ in pairs], [right for _, right in pairs]
+        assert lists.sum_of_distances == compute_sum_of_distances(data)
+        assert lists.similarity_score == compute_similarity_score(data)
+
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Day 01")
+    parser.add_argument("--stream", default=None, metavar="FILE", help="Solve FILE out of core")
+    parser.add_argument("--run-size", type=int, default=RUN_SIZE, help="Pairs per sorted run")
+    parser.add_argument("--tmp-dir", default=None, help="Directory of the spilled runs")
+    args = parser.parse_args()
+
+    if args.stream is not None:
+        solution_one, solution_two = solve_streaming(args.stream, args.run_size, args.tmp_dir)
+        print("Part one:", solution_one)
+        print("Part two:", solution_two)
+        return
+
     run_tests()
 
     data = read_input("data/input.txt")
@@ -56,4 +560,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
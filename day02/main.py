@@ -1,35 +1,94 @@
 """Day 02"""
+import os
+import sys
+from typing import Callable
+
+import numpy as np
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.loader import read_int_rows  # noqa: E402
+
+
 T_Report = list[int]
 T_Data = list[T_Report]
+T_Packed = tuple[np.ndarray, np.ndarray]  # Levels and offsets (CSR layout)
+
+# Levels are packed as int32 when their differences can't overflow
+_INT32_LIMIT = 2 ** 30
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [
-            [int(level) for level in report.split(" ")]
-            for report in fin
-        ]
+    values, offsets = read_int_rows(file)
+    levels, offsets = values.tolist(), offsets.tolist()
+
+    return [
+        levels[start:end]
+        for start, end in zip(offsets[:-1], offsets[1:])
+        if start < end
+    ]
 
 
 def count_safe_reports(data: T_Data) -> int:
     return len([report for report in data if is_safe(report)])
 
 
-def count_safe_reports_with_dampener(data: T_Data) -> int:
-    num_safe = 0
+def can_be_made_safe(report: T_Report, tolerance: int = 1) -> bool:
+    """
+    Single pass per direction, O(len(report) * (tolerance + 1)): `removals[i]`
+    is the fewest levels to remove from `report[:i + 1]` such that the kept
+    ones (ending with `report[i]`) are safe. A kept level can only follow one
+    of the `tolerance + 1` levels before it, any further gap costs too many
+    removals. No copies of the report are made.
+    """
+    num_levels = len(report)
+    if num_levels - tolerance <= 1:
+        return True
+
+    for sign in (1, -1):
+        removals = []
+
+        for idx, level in enumerate(report):
+            best = idx  # Remove all the levels before
+            for prev_idx in range(max(0, idx - tolerance - 1), idx):
+                if 1 <= (level - report[prev_idx]) * sign <= 3:
+                    best = min(best, removals[prev_idx] + idx - prev_idx - 1)
+            removals.append(best)
+
+            # No later level can follow any of the last ones within the tolerance
+            if idx > tolerance and min(removals[-tolerance - 1:]) > tolerance:
+                break
+        else:
+            last = range(num_levels - tolerance - 1, num_levels)
+            if min(removals[idx] + num_levels - 1 - idx for idx in last) <= tolerance:
+                return True
 
-    for report in data:
-        if is_safe(report):
-            num_safe += 1
-            continue
+    return False
 
-        for idx in range(len(report)):
-            modified_report = [*report[:idx], *report[idx + 1:]]
-            if is_safe(modified_report):
-                num_safe += 1
-                break
 
-    return num_safe
+def can_be_made_safe_naive(report: T_Report, tolerance: int = 1) -> bool:
+    """Tries every removal, recursively"""
+    if is_safe(report):
+        return True
+
+    if tolerance == 0:
+        return False
+
+    return any(
+        can_be_made_safe_naive([*report[:idx], *report[idx + 1:]], tolerance - 1)
+        for idx in range(len(report))
+    )
+
+
+def count_safe_reports_with_dampener(
+    data: T_Data,
+    tolerance: int = 1,
+    check: Callable[[T_Report, int], bool] = can_be_made_safe,
+) -> int:
+    """Reports that are safe after removing at most `tolerance` levels"""
+    return len([report for report in data if check(report, tolerance)])
 
 
 def is_safe(report: T_Report) -> bool:
@@ -42,10 +101,133 @@ def is_safe(report: T_Report) -> bool:
     return is_bounded and (is_increasing or is_decreasing)
 
 
+def pack_reports(data: T_Data) -> T_Packed:
+    """Flat levels, report `i` is `levels[offsets[i]:offsets[i + 1]]`"""
+    lengths = np.fromiter((len(report) for report in data), dtype=np.int64, count=len(data))
+    if not lengths.all():
+        raise ValueError(f"pack_reports: empty report at index {int(np.argmin(lengths))}")
+    levels = np.fromiter(
+        (level for report in data for level in report),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+
+    offsets = np.zeros(len(data) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    if len(levels) and np.abs(levels).max() < _INT32_LIMIT:
+        levels = levels.astype(np.int32)
+
+    return levels, offsets
+
+
+def read_packed(file: str) -> T_Packed:
+    """`pack_reports(read_input(file))` without the Python lists"""
+    values, offsets = read_int_rows(file)
+    lengths = np.diff(offsets)
+    lengths = lengths[lengths > 0]  # Skip empty lines
+
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    if len(values) and np.abs(values).max() < _INT32_LIMIT:
+        values = values.astype(np.int32)
+
+    return values, offsets
+
+
+def classify_reports(packed: T_Packed) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Safe reports, and safe reports with the dampener (one removal), of all
+    the (non-empty) reports at once.
+
+    Removing level `j` leaves a safe report iff the steps before `j - 1` and
+    after `j + 1` are good and so is the bridging step
+    `levels[j + 1] - levels[j - 1]`. The step conditions are differences of
+    the running count of bad steps, so every level is a candidate in O(1).
+    """
+    levels, offsets = packed
+    starts, ends = offsets[:-1], offsets[1:]
+    lengths = ends - starts
+    num_levels = len(levels)
+
+    if not len(starts):
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=bool)
+
+    positions = np.arange(num_levels)
+    start_of = np.repeat(starts, lengths)
+    end_of = np.repeat(ends, lengths)
+    local = positions - start_of
+
+    diffs = np.diff(levels)
+    bridges = levels[2:] - levels[:-2]
+
+    # Steps within a report, in report order (steps of report i start at offsets[i] - i)
+    is_inner = np.ones(max(0, num_levels - 1), dtype=bool)
+    is_inner[ends[:-1] - 1] = False
+    step_starts = starts - np.arange(len(starts))
+    has_steps = lengths > 1
+
+    is_safe = np.zeros(len(starts), dtype=bool)
+    is_safe_with_dampener = np.zeros(len(starts), dtype=bool)
+
+    for sign in (1, -1):
+        is_good = (diffs * sign >= 1) & (diffs * sign <= 3)
+
+        # Part one: all steps of a report good
+        all_good = np.ones(len(starts), dtype=bool)
+        inner_good = is_good[is_inner]
+        if len(inner_good):
+            all_good[has_steps] = np.logical_and.reduceat(inner_good, step_starts[has_steps])
+        is_safe |= all_good
+
+        # Part two: per removed level, with the number of bad steps before each position
+        num_bad = np.zeros(num_levels, dtype=np.int64)
+        np.cumsum(~is_good & is_inner, out=num_bad[1:])
+
+        prefix_good = (local < 2) | (num_bad[np.maximum(positions - 1, 0)] == num_bad[start_of])
+        suffix_good = (positions >= end_of - 2) | (
+            num_bad[end_of - 1] == num_bad[np.minimum(positions + 1, num_levels - 1)]
+        )
+
+        is_bridged = np.ones(num_levels, dtype=bool)
+        interior = (local >= 1) & (positions < end_of - 1)
+        interior_bridges = bridges[positions[interior] - 1] * sign
+        is_bridged[interior] = (interior_bridges >= 1) & (interior_bridges <= 3)
+
+        # A safe report stays safe without its first level
+        can_remove = prefix_good & suffix_good & is_bridged
+        is_safe_with_dampener |= np.logical_or.reduceat(can_remove, starts)
+
+    return is_safe, is_safe_with_dampener
+
+
+def count_safe_reports_vectorized(data: T_Data | T_Packed) -> int:
+    packed = data if isinstance(data, tuple) else pack_reports(data)
+    return int(classify_reports(packed)[0].sum())
+
+
+def count_safe_reports_with_dampener_vectorized(data: T_Data | T_Packed) -> int:
+    packed = data if isinstance(data, tuple) else pack_reports(data)
+    return int(classify_reports(packed)[1].sum())
+
+
 def run_tests() -> None:
     data = read_input("data/example.txt")
     assert count_safe_reports(data) == 2
     assert count_safe_reports_with_dampener(data) == 4
+    assert count_safe_reports_with_dampener(data, check=can_be_made_safe_naive) == 4
+    assert count_safe_reports_with_dampener(data, tolerance=0) == 2
+
+    assert count_safe_reports_vectorized(data) == 2
+    assert count_safe_reports_with_dampener_vectorized(read_packed("data/example.txt")) == 4
+
+    try:
+        pack_reports([[7, 11], [], []])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("pack_reports accepted an empty report")
 
 
 def main() -> None:
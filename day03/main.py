@@ -1,42 +1,196 @@
-"""Day 03"""
+"""Day 03
+
+The `do()` / `don't()` state only looks sequential: a byte range is
+summarized as (sum if enabled at its start, sum if disabled at its start,
+state at its end), and summaries of consecutive ranges `combine`
+associatively. `python main.py --parallel FILE` scans ranges of a huge dump
+on a process pool and folds their summaries.
+"""
+import argparse
+import functools
+import math
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
 
-T_Memory = str
+from aoc.loader import map_file  # noqa: E402
 
 
-def read_input(file: str) -> T_Memory:
-    with open(file, "r") as fin:
-        return fin.read()
+# Memory-mapped dump (or any bytes-like object / str)
+T_Memory = bytes | str
+
+# (sum if enabled at the start, sum if disabled at the start, state at the
+# end - None if the range has no `do()` / `don't()`)
+T_Summary = tuple[int, int, bool | None]
+
+CHUNK_SIZE = 1 << 20
+
+# Longest possible match, `don't(123,456)`
+MAX_TOKEN_LENGTH = 14
 
+# Smallest byte range scanned by a worker of the parallel mode
+MIN_RANGE_SIZE = 1 << 22
 
-def run_multiplications(memory: T_Memory) -> int:
+_MUL_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+_INSTRUCTION_PATTERN = re.compile(rb"(mul|do|don't)\((?:(\d{1,3}),(\d{1,3}))?\)")
+
+
+def read_input(file: str) -> T_Memory:
+    return map_file(file)
+
+
+def scan(
+    memory: T_Memory,
+    pattern: re.Pattern,
+    chunk_size: int = CHUNK_SIZE,
+    stop: int | None = None,
+) -> Iterator[re.Match]:
+    """
+    `pattern.finditer(memory)` over chunks, holding at most `chunk_size` +
+    `MAX_TOKEN_LENGTH` bytes at a time. Matches starting in the last
+    `MAX_TOKEN_LENGTH - 1` bytes of a chunk might be cut off, so that tail
+    is carried over and scanned again together with the next chunk.
+
+    With `stop`, only the matches starting before it are yielded (the bytes
+    after it just complete them).
+    """
+    if isinstance(memory, str):
+        memory = memory.encode()
+
+    view = memoryview(memory)
+    stop = len(view) if stop is None else stop
+    carry = b""
+
+    for start in range(0, len(view), chunk_size):
+        buffer = carry + view[start:start + chunk_size]
+        buffer_start = start - len(carry)
+
+        if start + chunk_size >= len(view):
+            safe_end = len(buffer)
+        else:
+            safe_end = max(0, len(buffer) - MAX_TOKEN_LENGTH + 1)
+
+        cut = safe_end
+        for match in pattern.finditer(buffer):
+            if match.start() >= safe_end:
+                break
+            if buffer_start + match.start() >= stop:
+                return
+
+            yield match
+            cut = max(cut, match.end())
+
+        carry = buffer[cut:]
+
+
+def run_multiplications(memory: T_Memory, chunk_size: int = CHUNK_SIZE) -> int:
     result = 0
 
-    for x, y in re.findall("mul\((\d{1,3})\,(\d{1,3})\)", memory):
-        result += int(x) * int(y)
+    for match in scan(memory, _MUL_PATTERN, chunk_size):
+        result += int(match[1]) * int(match[2])
 
     return result
 
 
-def run_multiplications_with_conditionals(memory: T_Memory) -> int:
+def run_multiplications_with_conditionals(memory: T_Memory, chunk_size: int = CHUNK_SIZE) -> int:
     result = 0
     enabled = True
 
-    for token in re.findall(
-        pattern="(?P<name>mul|do|don't)\((?:(\d{1,3})\,(\d{1,3}))?\)",
-        string=memory,
-    ):
-        if enabled and token[0] == "mul":
-            result += int(token[1]) * int(token[2])
-        elif token[0] == "do":
+    for match in scan(memory, _INSTRUCTION_PATTERN, chunk_size):
+        name = match[1]
+
+        if enabled and name == b"mul" and match[2] is not None:
+            result += int(match[2]) * int(match[3])
+        elif name == b"do":
             enabled = True
-        elif token[0] == "don't":
+        elif name == b"don't":
             enabled = False
 
     return result
 
 
+def summarize(
+    memory: T_Memory,
+    chunk_size: int = CHUNK_SIZE,
+    stop: int | None = None,
+) -> T_Summary:
+    enabled_sum, disabled_sum, state = 0, 0, None
+
+    for match in scan(memory, _INSTRUCTION_PATTERN, chunk_size, stop):
+        name = match[1]
+
+        if name == b"mul" and match[2] is not None:
+            product = int(match[2]) * int(match[3])
+            if state is None:
+                enabled_sum += product
+            elif state:
+                enabled_sum += product
+                disabled_sum += product
+        elif name == b"do":
+            state = True
+        elif name == b"don't":
+            state = False
+
+    return enabled_sum, disabled_sum, state
+
+
+def combine(first: T_Summary, second: T_Summary) -> T_Summary:
+    """Summary of two consecutive ranges, associative with identity (0, 0, None)"""
+    first_enabled, first_disabled, first_state = first
+    second_enabled, second_disabled, second_state = second
+
+    def continued(enabled: bool) -> int:
+        if first_state is not None:
+            enabled = first_state
+        return second_enabled if enabled else second_disabled
+
+    return (
+        first_enabled + continued(True),
+        first_disabled + continued(False),
+        first_state if second_state is None else second_state,
+    )
+
+
+def summarize_range(file: str, start: int, end: int, chunk_size: int = CHUNK_SIZE) -> T_Summary:
+    """Summary of the matches starting in `[start, end)` of the file"""
+    memory = memoryview(map_file(file))
+    overlap_end = min(len(memory), end + MAX_TOKEN_LENGTH - 1)
+
+    return summarize(memory[start:overlap_end], chunk_size, stop=end - start)
+
+
+def run_multiplications_with_conditionals_parallel(
+    file: str,
+    max_workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    min_range_size: int = MIN_RANGE_SIZE,
+) -> int:
+    """Same as `run_multiplications_with_conditionals`, byte ranges on a process pool"""
+    size = os.path.getsize(file)
+    max_workers = max_workers or os.cpu_count()
+
+    # A few ranges per worker, for balance
+    num_ranges = max(1, min(4 * max_workers, math.ceil(size / min_range_size)))
+    range_size = math.ceil(size / num_ranges) if size else 0
+    starts = list(range(0, size, range_size)) if size else []
+    ends = [min(size, start + range_size) for start in starts]
+
+    args = ([file] * len(starts), starts, ends, [chunk_size] * len(starts))
+
+    if len(starts) <= 1 or max_workers == 1:
+        return functools.reduce(combine, map(summarize_range, *args), (0, 0, None))[0]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Summaries in range order, folded as they arrive
+        return functools.reduce(combine, executor.map(summarize_range, *args), (0, 0, None))[0]
+
+
 def run_tests() -> None:
     data = read_input("data/example.txt")
     assert run_multiplications(data) == 161
@@ -44,8 +198,31 @@ def run_tests() -> None:
     data = read_input("data/example2.txt")
     assert run_multiplications_with_conditionals(data) == 48
 
+    # Every token split across chunk boundaries
+    for chunk_size in range(1, 20):
+        assert run_multiplications_with_conditionals(data, chunk_size=chunk_size) == 48
+
+    # Every split into ranges
+    for range_size in range(1, 20):
+        assert run_multiplications_with_conditionals_parallel(
+            "data/example2.txt",
+            max_workers=1,
+            min_range_size=range_size,
+        ) == 48
+
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Day 03")
+    parser.add_argument("--parallel", default=None, metavar="FILE", help="Solve FILE on a process pool")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Worker processes, 0 means all cores")
+    args = parser.parse_args()
+
+    if args.parallel is not None:
+        data = read_input(args.parallel)
+        print("Part one:", run_multiplications(data))
+        print("Part two:", run_multiplications_with_conditionals_parallel(args.parallel, args.jobs or None))
+        return
+
     run_tests()
 
     data = read_input("data/input.txt")
@@ -59,4 +236,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
@@ -1,78 +1,83 @@
 """Day 04"""
-from itertools import product
+import os
+import sys
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
 
-T_Data = list[str]
+from aoc.grid import DELTAS_8, Grid  # noqa: E402
+from aoc.loader import parse_grid  # noqa: E402
+from aoc.wordsearch import count_words, find_words  # noqa: E402
+
+
+T_Data = Grid
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [line.strip() for line in fin.readlines()]
+    return Grid.from_file(file)
 
 
 def find_num_xmas(data: T_Data) -> int:
-    counter = 0
+    return find_num_word(data, "XMAS")
 
-    width, height = len(data[0]), len(data)
 
-    deltas = [-1, 0, 1]
-    word_len = 4
+def find_num_word(data: T_Data, word: str) -> int:
+    counter = 0
 
-    for start_x, start_y in product(range(width), range(height)):
-        if data[start_y][start_x] != "X":
-            continue
+    for dx, dy in DELTAS_8:
+        matches = data.mask(word[0])
 
-        for dx, dy in product(deltas, repeat=2):
-            indices = [
-                (start_x + i * dx, start_y + i * dy)
-                for i in range(word_len)
-            ]
+        for i, letter in enumerate(word[1:], start=1):
+            matches &= data.shifted(i * dx, i * dy) == ord(letter)
 
-            if any(x < 0 or x >= width for x, _ in indices):
-                continue
+        counter += int(matches.sum())
 
-            if any(y < 0 or y >= height for _, y in indices):
-                continue
+    return counter
 
-            word = "".join(data[y][x] for x, y in indices)
-            if word == "XMAS":
-                counter += 1
 
-    return counter
+def find_num_xmas_aho_corasick(data: T_Data) -> int:
+    """Same as `find_num_xmas`, via the general multi-word search"""
+    return count_words(data, ["XMAS"])["XMAS"]
 
 
 def find_num_crossed_mas(data: T_Data) -> int:
-    counter = 0
+    M, S = ord("M"), ord("S")
 
-    width, height = len(data[0]), len(data)
-
-    for start_x, start_y in product(range(1, width - 1), range(1, height - 1)):
-        diagonal = "".join([
-            data[start_y - 1][start_x - 1],
-            data[start_y][start_x],
-            data[start_y + 1][start_x + 1],
-        ])
-        antidiagonal = "".join([
-            data[start_y + 1][start_x - 1],
-            data[start_y][start_x],
-            data[start_y - 1][start_x + 1],
-        ])
-
-        if (
-            data[start_y][start_x] == "A"
-            and diagonal in ("MAS", "SAM")
-            and antidiagonal in ("MAS", "SAM")
-        ):
-            counter += 1
+    top_left, bottom_right = data.shifted(-1, -1), data.shifted(1, 1)
+    bottom_left, top_right = data.shifted(-1, 1), data.shifted(1, -1)
 
-    return counter
+    diagonal = (
+        ((top_left == M) & (bottom_right == S))
+        | ((top_left == S) & (bottom_right == M))
+    )
+    antidiagonal = (
+        ((bottom_left == M) & (top_right == S))
+        | ((bottom_left == S) & (top_right == M))
+    )
+
+    counter = data.mask("A") & diagonal & antidiagonal
+    return int(counter.sum())
 
 
 def run_tests() -> None:
     data = read_input("data/example.txt")
     assert find_num_xmas(data) == 18
+    assert find_num_xmas_aho_corasick(data) == 18
     assert find_num_crossed_mas(data) == 9
 
+    # Overlapping words, a palindrome and a word with its reversal
+    words = ["XMAS", "SAMX", "MAS", "AS", "SAS", "A", "XMASAMX"]
+    expected = {word: find_num_word(data, word) for word in words}
+    assert count_words(data, words) == expected
+    assert len(find_words(data, words)) == sum(expected.values())
+    assert count_words(data, []) == {} and find_words(data, []) == []
+
+    # CRLF line endings parse to the same grid
+    with open("data/example.txt", "rb") as fin:
+        raw = fin.read()
+    assert Grid.from_array(parse_grid(raw.replace(b"\n", b"\r\n"))) == data
+
 
 def main() -> None:
     run_tests()
@@ -1,24 +1,28 @@
 """Day 06"""
-from copy import deepcopy
+import os
+import sys
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
 
-T_Data = list[list[str]]
+from aoc import counters  # noqa: E402
+from aoc.grid import Grid  # noqa: E402
+
+
+T_Data = Grid
 T_Position = tuple[int, int]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [list(line.strip()) for line in fin.readlines()]
+    return Grid.from_file(file)
 
 
 def get_guard_start_position(data: T_Data) -> T_Position:
-    for y, line in enumerate(data):
-        if "^" in line:
-            start_y = y
-            start_x = line.index("^")
-            return start_x, start_y
-
-    raise RuntimeError("Guard not found")
+    try:
+        return data.find_one("^")
+    except ValueError:
+        raise RuntimeError("Guard not found")
 
 
 def run_guard_simulation(
@@ -28,7 +32,8 @@ def run_guard_simulation(
 ) -> tuple[int, bool]:
     guard_positions_with_directions = set()
 
-    width, height = len(data[0]), len(data)
+    width, height = data.width, data.height
+    cells, obstacle = data.buffer, ord("#")
     dx, dy = 0, -1  # Move up
     guard_x, guard_y = start_x, start_y
 
@@ -46,6 +51,8 @@ def run_guard_simulation(
 
         # Stuck in loop
         if (next_x, next_y, dx, dy) in guard_positions_with_directions:
+            if counters.ENABLED:  # One state per step / turn
+                counters.add("day06.guard_steps", len(guard_positions_with_directions))
             return -1, True
 
         # Has left map
@@ -57,10 +64,12 @@ def run_guard_simulation(
                 (x, y)
                 for x, y, _, _ in guard_positions_with_directions
             })
+            if counters.ENABLED:
+                counters.add("day06.guard_steps", len(guard_positions_with_directions))
             return num_unique_positions, False
 
         # In front of obstacle
-        if data[next_y][next_x] == "#":
+        if cells[next_y * width + next_x] == obstacle:
             dx, dy = _right_turns[(dx, dy)]
             continue
 
@@ -84,25 +93,23 @@ def solve_part_one(data: T_Data) -> int:
 def solve_part_two(data: T_Data) -> int:
     result = 0
 
-    width, height = len(data[0]), len(data)
     guard_x, guard_y = get_guard_start_position(data)
 
-    for x in range(width):
-        for y in range(height):
-            if data[y][x] in ("#", "^"):
-                continue
+    for x, y in data.find("."):
+        map_ = data.copy()
+        map_[x, y] = "#"
 
-            map_ = deepcopy(data)
-            map_[y][x] = "#"
+        _, stuck_in_loop = run_guard_simulation(
+            data=map_,
+            start_x=guard_x,
+            start_y=guard_y,
+        )
 
-            _, stuck_in_loop = run_guard_simulation(
-                data=map_,
-                start_x=guard_x,
-                start_y=guard_y,
-            )
+        if stuck_in_loop:
+            result += 1
 
-            if stuck_in_loop:
-                result += 1
+        if counters.ENABLED:
+            counters.add("day06.candidates")
 
     return result
 
@@ -1,16 +1,25 @@
 """Day 07"""
+import os
+import sys
 from itertools import product
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.loader import read_int_rows  # noqa: E402
+
 T_Data = list[tuple[int, list[int]]]
 
 
 def read_input(file: str) -> T_Data:
+    values, offsets = read_int_rows(file, signed=False)
+    values, offsets = values.tolist(), offsets.tolist()
+
     equations = []
-    with open(file, "r") as fin:
-        for line in fin:
-            expected_result, raw_numbers = line.strip().split(":")
-            numbers = [int(num) for num in raw_numbers.strip().split(" ")]
-            equations.append((int(expected_result), numbers))
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        if start < end:
+            equations.append((values[start], values[start + 1:end]))
 
     return equations
 
@@ -1,14 +1,23 @@
 """Day 08"""
+import os
+import sys
 from collections import defaultdict
 from itertools import product
 
-T_Data = list[list[str]]
+import numpy as np
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.grid import Grid  # noqa: E402
+
+T_Data = Grid
 T_Position = tuple[int, int]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [list(line.strip()) for line in fin.readlines()]
+    return Grid.from_file(file)
 
 
 def vec_shift(a: T_Position, b: T_Position, scale: int) -> T_Position:
@@ -27,14 +36,8 @@ def get_antinodes_locations(data: T_Data, scale: int) -> list[T_Position]:
     antinode_locations = []
     frequencies = defaultdict(list)
 
-    for y, line in enumerate(data):
-        for x, value in enumerate(line):
-            if value == ".":
-                continue
-
-            frequencies[value].append((x, y))
-
-    width, height = len(data[0]), len(data)
+    for y, x in np.argwhere(~data.mask(".")).tolist():
+        frequencies[data[x, y]].append((x, y))
 
     for freq, antennas in frequencies.items():
         for a1, a2 in product(antennas, repeat=2):
@@ -43,10 +46,7 @@ def get_antinodes_locations(data: T_Data, scale: int) -> list[T_Position]:
 
             loc_x, loc_y = vec_shift(a1, a2, scale=scale)
 
-            if loc_x < 0 or loc_x >= width:
-                continue
-
-            if loc_y < 0 or loc_y >= height:
+            if not data.in_bounds(loc_x, loc_y):
                 continue
 
             antinode_locations.append((loc_x, loc_y))
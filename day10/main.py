@@ -1,106 +1,67 @@
 """Day 10"""
-import heapq
+import os
 import sys
 
 from collections import defaultdict
+from typing import Iterator
 
+import numpy as np
 
-T_Data = list[list[int]]
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.grid import Grid  # noqa: E402
+from aoc.search import INF, bfs  # noqa: E402
+
+
+T_Data = Grid
 T_Node = tuple[int, int, int]
 T_Adj = dict[T_Node, list[T_Node]]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [
-            [int(value) for value in line.strip()]
-            for line in fin.readlines()
-        ]
+    return Grid.from_file(file)
 
 
 def to_graph(data: T_Data) -> tuple[list[T_Node], T_Adj]:
     nodes = []
     adj = defaultdict(list)
 
-    width, height = len(data[0]), len(data)
-    for y, line in enumerate(data):
-        for x, value in enumerate(line):
-            node = (x, y, value)
-            nodes.append(node)
-
-            for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-                if (
-                    0 <= (x + dx) < width
-                    and 0 <= (y + dy) < height
-                    and data[y + dy][x + dx] == value + 1
-                ):
-                    neighbor = (x + dx, y + dy, data[y + dy][x + dx])
-                    adj[node].append(neighbor)
-
-    return nodes, adj
-
-
-class NodePriorityQueue:
-
-    def __init__(self):
-        self._nodes_pq = []
-
-    def add(self, node: T_Node, weight: int):
-        heapq.heappush(self._nodes_pq, (weight, node))
-
-    def pop(self) -> tuple[int, T_Node]:
-        return heapq.heappop(self._nodes_pq)
-
-    def __len__(self) -> int:
-        return len(self._nodes_pq)
-
+    heights = (data.cells - ord("0")).tolist()
 
-def dijkstra(
-    nodes: list[T_Node],
-    adj: T_Adj,
-    start_node: T_Node,
-) -> dict[T_Node, int]:
-    Q = NodePriorityQueue()
+    for x, y in data.positions():
+        value = heights[y][x]
+        node = (x, y, value)
+        nodes.append(node)
 
-    dist = {}
+        for new_x, new_y in data.neighbors(x, y):
+            if heights[new_y][new_x] == value + 1:
+                neighbor = (new_x, new_y, heights[new_y][new_x])
+                adj[node].append(neighbor)
 
-    for v in nodes:
-        dist[v] = sys.maxsize
-
-    dist[start_node] = 0
-    Q.add(node=start_node, weight=0)
-
-    while len(Q) > 0:
-        dist_u, u = Q.pop()
+    return nodes, adj
 
-        if dist_u > dist[u]:
-            continue
 
-        for v in adj[u]:
-            alt = dist_u + 1
-            if alt < dist[v]:
-                dist[v] = alt
-                Q.add(node=v, weight=alt)
+def solve_part_one(data: T_Data) -> int:
+    result = 0
 
-    return dist
+    heights = (data.cells - ord("0")).ravel()
+    levels = heights.tolist()
 
+    def _uphill(u: int) -> Iterator[int]:
+        for v in data.flat_neighbors(u):
+            if levels[v] == levels[u] + 1:
+                yield v
 
-def solve_part_one(data: T_Data) -> int:
-    result = 0
+    num_nodes = data.width * data.height
+    is_summit = heights == 9
 
-    nodes, adj = to_graph(data)
-    
-    start_nodes = [node for node in nodes if node[2] == 0]
+    for start in np.flatnonzero(heights == 0).tolist():
+        dists, _ = bfs(num_nodes, [start], _uphill)
+        reachable = np.frombuffer(dists, dtype=np.int64) != INF
 
-    for sn in start_nodes:
-        dists = dijkstra(nodes, adj, start_node=sn)
-        end_dists = {
-            n: dists[n]
-            for n in nodes
-            if dists[n] < sys.maxsize and n[2] == 9
-        }
-
-        result += len(end_dists)
+        result += int((reachable & is_summit).sum())
 
     return result
 
@@ -1,13 +1,20 @@
 """Day 11"""
+import os
+import sys
 from collections import defaultdict
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.loader import read_ints  # noqa: E402
+
 
 T_Data = list[int]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [int(value) for value in fin.read().split(" ")]
+    return read_ints(file).tolist()
 
 
 def run_pebble_iteration(stones: T_Data) -> T_Data:
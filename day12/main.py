@@ -1,11 +1,20 @@
 """Day 12"""
-T_Data = list[list[str]]
+import os
+import sys
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.grid import Grid  # noqa: E402
+
+
+T_Data = Grid
 T_Position = tuple[int, int]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [list(line.strip()) for line in fin.readlines()]
+    return Grid.from_file(file)
 
 
 def find_regions(data: T_Data) -> list[list[T_Position]]:
@@ -13,41 +22,25 @@ def find_regions(data: T_Data) -> list[list[T_Position]]:
 
     visited: set[T_Position] = set()
 
-    width, height = len(data[0]), len(data)
-
     def dfs(pos: T_Position) -> list[T_Position]:
         region = [pos]
         visited.add(pos)
 
         x, y = pos
-        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            new_x = x + dx
-            new_y = y + dy
-
-            new_pos = new_x, new_y
-
-            if not (0 <= new_x < width):
-                continue
-
-            if not (0 <= new_y < height):
-                continue
-
+        for new_pos in data.neighbors(x, y):
             if new_pos in visited:
                 continue
 
-            if data[new_y][new_x] == data[y][x]:
+            if data[new_pos] == data[pos]:
                 region.extend(dfs(new_pos))
 
         return region
 
-    for y, row in enumerate(data):
-        for x, garden_type in enumerate(row):
-            current_pos = (x, y)
-
-            if current_pos in visited:
-                continue
+    for current_pos in data.positions():
+        if current_pos in visited:
+            continue
 
-            regions.append(dfs(current_pos))
+        regions.append(dfs(current_pos))
 
     return regions
 
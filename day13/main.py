@@ -44,7 +44,7 @@ def solve_naive(
 ) -> int | None:
     # Naive approach - just test all the cases and find the minimum
     num_tokens = sys.maxsize
-    for A, B in product(range(1, max_iter + 1), repeat=2):
+    for A, B in product(range(max_iter + 1), repeat=2):
         pos = A * Ax + B * Bx, A * Ay + B * By
 
         if pos == (Px, Py):
@@ -64,6 +64,7 @@ def solve_efficient(
     By: int,
     Px: int,
     Py: int,
+    max_iter: int | None = None,
 ) -> int | None:
     """
     [[Ax Bx],    [A     [Px
@@ -91,6 +92,10 @@ def solve_efficient(
     if B_num % det == 0 and A_num % det == 0:
         A = A_num // det
         B = B_num // det
+
+        if A < 0 or B < 0 or (max_iter is not None and max(A, B) > max_iter):
+            return None
+
         num_tokens = 3 * A + B
 
         return num_tokens
@@ -102,7 +107,7 @@ def solve_part_one(data: T_Data, fn) -> int:
     result = 0
     
     for (Ax, Ay), (Bx, By), (Px, Py) in data:
-        num_tokens = fn(Ax, Ay, Bx, By, Px, Py)
+        num_tokens = fn(Ax, Ay, Bx, By, Px, Py, max_iter=100)
         if num_tokens:
             result += num_tokens
 
@@ -134,6 +139,11 @@ def run_tests() -> None:
     assert solve_part_one(data, solve_naive) == 480
     assert solve_part_one(data, solve_efficient) == 480
 
+    # The only solutions press A a negative number of times (-1, -10^13): no prize
+    assert solve_efficient(2, 1, 1, 2, 3, 9) is None
+    assert solve_naive(2, 1, 1, 2, 3, 9) is None
+    assert solve_part_two([((3, 1), (2, 1), (0, 0))]) == 0
+
 
 def main() -> None:
     run_tests()
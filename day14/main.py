@@ -4,9 +4,6 @@ import re
 import sys
 from collections import defaultdict
 
-import numpy as np
-from PIL import Image
-
 
 T_Vec2D = tuple[int, int]
 T_Robot = tuple[T_Vec2D, T_Vec2D]
@@ -77,6 +74,10 @@ def solve_part_one(data: T_Data, width: int, height: int) -> int:
 
 
 def solve_part_two(data: T_Data) -> int:
+    # Heavy imports, only needed for rendering
+    import numpy as np
+    from PIL import Image
+
     width, height = 101, 103
     for i in range(1, 10_000 + 1):
         out_pos = simulate_robots(data, width, height, num_seconds=i)
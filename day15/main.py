@@ -1,11 +1,19 @@
 """Day 15"""
+import os
+import sys
 from copy import deepcopy
 from typing import Literal
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.grid import Grid  # noqa: E402
+
 
 T_Vec2D = tuple[int, int]
 T_Instruction = Literal["<", "^", ">", "v"]
-T_Map = list[list[str]]
+T_Map = Grid
 T_Data = tuple[T_Map, list[T_Instruction]]
 
 DIRECTIONS = {
@@ -20,7 +28,7 @@ def read_input(file: str) -> T_Data:
     with open(file, "r") as fin:
         raw_map, raw_instructions = fin.read().strip().split("\n\n")
 
-        map_ = [list(line) for line in raw_map.split("\n")]
+        map_ = Grid.from_lines(raw_map.split("\n"))
         instructions = [
             instruction
             for line in raw_instructions.split("\n")
@@ -31,17 +39,11 @@ def read_input(file: str) -> T_Data:
 
 
 def get_robot_position(map_: T_Map) -> T_Vec2D:
-    for y, line in enumerate(map_):
-        for x, value in enumerate(line):
-            if value == "@":
-                return x, y
+    return map_.find_one("@")
 
 
 def move(map_: T_Map, src: T_Vec2D, dst: T_Vec2D) -> None:
-    x1, y1 = src
-    x2, y2 = dst
-
-    map_[y1][x1], map_[y2][x2] = map_[y2][x2], map_[y1][x1]
+    map_[src], map_[dst] = map_[dst], map_[src]
 
 
 def try_to_move_box(map_: T_Map, pos: T_Vec2D, delta: T_Vec2D) -> None:
@@ -50,14 +52,14 @@ def try_to_move_box(map_: T_Map, pos: T_Vec2D, delta: T_Vec2D) -> None:
 
     new_x, new_y = x + dx, y + dy
 
-    if map_[new_y][new_x] == ".":
+    if map_[new_x, new_y] == ".":
         move(map_, (x, y), (new_x, new_y))
-    elif map_[new_y][new_x] == "#":
+    elif map_[new_x, new_y] == "#":
         pass
-    elif map_[new_y][new_x] == "O":
+    elif map_[new_x, new_y] == "O":
         try_to_move_box(map_, (new_x, new_y), delta)
 
-        if map_[new_y][new_x] == ".":
+        if map_[new_x, new_y] == ".":
             move(map_, (x, y), (new_x, new_y))
 
 
@@ -70,23 +72,21 @@ def solve_part_one(data: T_Data) -> int:
 
         new_x, new_y = robot_x + dx, robot_y + dy
 
-        if map_[new_y][new_x] == ".":  # Move to the next position
+        if map_[new_x, new_y] == ".":  # Move to the next position
             move(map_, (robot_x, robot_y), (new_x, new_y))
             robot_x, robot_y = new_x, new_y
-        elif map_[new_y][new_x] == "#":  # Blocked path - do nothing
+        elif map_[new_x, new_y] == "#":  # Blocked path - do nothing
             pass
-        elif map_[new_y][new_x] == "O":  # Box - check if can be moved
+        elif map_[new_x, new_y] == "O":  # Box - check if can be moved
             try_to_move_box(map_, (new_x, new_y), (dx, dy))
 
-            if map_[new_y][new_x] == ".":  # Box was moved
+            if map_[new_x, new_y] == ".":  # Box was moved
                 move(map_, (robot_x, robot_y), (new_x, new_y))
                 robot_x, robot_y = new_x, new_y
         
     gps = [
         100 * y + x
-        for y, line in enumerate(map_)
-        for x, value in enumerate(line)
-        if value == "O"
+        for x, y in map_.find("O")
     ]
     result = sum(gps)
 
@@ -95,21 +95,17 @@ def solve_part_one(data: T_Data) -> int:
 
 def enlarge_map(map_: T_Map) -> T_Map:
     _mapping = {
-        "#": ["#", "#"],
-        "O": ["[", "]"],
-        ".": [".", "."],
-        "@": ["@", "."],
+        "#": "##",
+        "O": "[]",
+        ".": "..",
+        "@": "@.",
     }
 
     out = [
-        [
-            c
-            for value in line
-            for c in _mapping[value]
-        ]
-        for line in map_
+        "".join(_mapping[value] for value in line)
+        for line in map_.lines()
     ]
-    return out
+    return Grid.from_lines(out)
 
 
 class BigBox:
@@ -200,18 +196,11 @@ def solve_part_two(data: T_Data) -> int:
     robot_x, robot_y = get_robot_position(map_)
 
     boxes = {
-        (x, y): BigBox(x, y, value)
-        for y, line in enumerate(map_)
-        for x, value in enumerate(line)
-        if value in ("[", "]")
+        (x, y): BigBox(x, y, map_[x, y])
+        for x, y in map_.find("[]")
     }
 
-    walls = set(
-        (x, y)
-        for y, line in enumerate(map_)
-        for x, value in enumerate(line)
-        if value == "#"
-    )
+    walls = set(map_.find("#"))
 
     for inst in instructions:
         dx, dy = DIRECTIONS[inst]
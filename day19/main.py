@@ -1,6 +1,14 @@
 """Day 19"""
+import os
+import sys
 from functools import lru_cache
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc import counters  # noqa: E402
+
 
 T_Data = tuple[list[str], list[str]]
 
@@ -29,8 +37,16 @@ def count_towel_sequences(towels: tuple[str], design: str) -> int:
     return count
 
 
+def _count_calls(before: tuple) -> None:
+    """Recursive calls since `before` (`cache_info()`), derived from the cache stats"""
+    after = count_towel_sequences.cache_info()
+    counters.add("day19.calls", after.hits + after.misses - before.hits - before.misses)
+    counters.add("day19.cache_misses", after.misses - before.misses)
+
+
 def solve_part_one(data: T_Data) -> int:
     towels, designs = data
+    cache_info = count_towel_sequences.cache_info()
 
     result = 0
 
@@ -41,11 +57,15 @@ def solve_part_one(data: T_Data) -> int:
         if count > 0:
             result += 1
 
+    if counters.ENABLED:
+        _count_calls(cache_info)
+
     return result
 
 
 def solve_part_two(data: T_Data) -> int:
     towels, designs = data
+    cache_info = count_towel_sequences.cache_info()
 
     result = 0
 
@@ -53,6 +73,9 @@ def solve_part_two(data: T_Data) -> int:
         useful_towels = tuple(towel for towel in towels if towel in design)
         result += count_towel_sequences(useful_towels, design)
 
+    if counters.ENABLED:
+        _count_calls(cache_info)
+
     return result
 
 
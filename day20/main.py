@@ -1,94 +1,58 @@
 """Day 20"""
-import heapq
+import os
 import sys
 from collections import defaultdict
+from typing import Iterator
 
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
 
-T_Data = list[list[str]]
+from aoc.grid import Grid  # noqa: E402
+from aoc.search import INF, bfs, reconstruct_path  # noqa: E402
+
+
+T_Data = Grid
 T_Position = tuple[int, int]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [list(line.strip()) for line in fin.readlines()]
+    return Grid.from_file(file)
 
 
 def find_start_end_positions(grid: T_Data) -> tuple[T_Position, T_Position]:
-    start_pos, end_pos = None, None
-
-    for y, line in enumerate(grid):
-        for x, value in enumerate(line):
-            if value == "S":
-                start_pos = (x, y)
-            elif value == "E":
-                end_pos = (x, y)
-
-    assert start_pos is not None
-    assert end_pos is not None
+    return grid.find_one("S"), grid.find_one("E")
 
-    return start_pos, end_pos
 
-
-def dijkstra(
+def find_path(
     grid: T_Data,
     start_pos: T_Position,
     end_pos: T_Position,
-) -> tuple[dict[T_Position, int], dict[T_Position, T_Position]]:
-    width, height = len(grid[0]), len(grid)
-
-    Q = []
-    dists = {}
-    prev = {}
-
-    for y, line in enumerate(grid):
-        for x, value in enumerate(line):
-            if value == ".":
-                dists[(x, y)] = sys.maxsize
-    dists[end_pos] = sys.maxsize
+) -> list[T_Position]:
+    wall = ord("#")
 
-    Q.append((0, start_pos))
-    dists[start_pos] = 0
-    prev[start_pos] = None
+    def _neighbors(u: int) -> Iterator[int]:
+        for v in grid.flat_neighbors(u):
+            if grid.buffer[v] != wall:
+                yield v
 
-    while Q:
-        dist_u, (ux, uy) = heapq.heappop(Q)
+    end_idx = grid.index(*end_pos)
+    dists, prev = bfs(
+        num_nodes=grid.width * grid.height,
+        sources=[grid.index(*start_pos)],
+        neighbors=_neighbors,
+        targets=[end_idx],
+    )
 
-        if (ux, uy) == end_pos:
-            return dists, prev
+    if dists[end_idx] == INF:
+        raise RuntimeError("Did not find end position")
 
-        if dist_u > dists[(ux, uy)]:
-            continue
-
-        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            new_x, new_y = ux + dx, uy + dy
-
-            if not (0 <= new_x < width):
-                continue
-
-            if not (0 <= new_y < height):
-                continue
-
-            if grid[new_y][new_x] == "#":
-                continue
-
-            alt = dist_u + 1
-            if alt < dists[(new_x, new_y)]:
-                dists[(new_x, new_y)] = alt
-                prev[(new_x, new_y)] = (ux, uy)
-                heapq.heappush(Q, (alt, (new_x, new_y)))
-
-    raise RuntimeError("Did not find end position")
+    return [grid.position(idx) for idx in reconstruct_path(prev, end_idx)]
 
 
 def count_cheats(data: T_Data, max_cheat_duration: int) -> dict[int, int]:
     start_pos, end_pos = find_start_end_positions(data)
-    _, prev = dijkstra(data, start_pos, end_pos)
-
-    path = [end_pos]
-    pos = end_pos
-    while prev[pos] is not None:
-        path = [prev[pos], *path]
-        pos = prev[pos]
+    path = find_path(data, start_pos, end_pos)
 
     count = defaultdict(int)
 
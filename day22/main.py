@@ -1,10 +1,19 @@
 """Day 22"""
+import os
+import sys
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+from aoc.loader import read_ints  # noqa: E402
+
+
 T_Data = list[int]
 
 
 def read_input(file: str) -> T_Data:
-    with open(file, "r") as fin:
-        return [int(line.strip()) for line in fin.readlines()]
+    return read_ints(file).tolist()
 
 
 def pseudorandom_step(secret: int) -> int:
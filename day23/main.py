@@ -1,6 +1,4 @@
 """Day 23"""
-import networkx as nx
-
 T_Data = list[tuple[str, str]]
 
 
@@ -16,6 +14,8 @@ def read_input(file: str) -> T_Data:
 
 
 def solve_part_one(data: T_Data) -> int:
+    import networkx as nx  # Slow to import, keep `read_input` cheap
+
     g = nx.Graph()
     g.add_edges_from(data)
 
@@ -31,6 +31,8 @@ def solve_part_one(data: T_Data) -> int:
 
 
 def solve_part_two(data: T_Data) -> str:
+    import networkx as nx
+
     g = nx.Graph()
     g.add_edges_from(data)
 